@@ -6,7 +6,7 @@ validation using Pydantic models.
 
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class ServerConfig(BaseModel):
@@ -19,6 +19,10 @@ class ServerConfig(BaseModel):
         disabled: Whether this server should be skipped (default: False)
     """
 
+    # Defer schema-validator construction until first validation, so importing
+    # this module (e.g. for --help or pure code generation) stays cheap
+    model_config = ConfigDict(defer_build=True)
+
     command: str = Field(..., description="Command to execute the MCP server")
     args: list[str] = Field(default_factory=list, description="Arguments for the command")
     env: dict[str, str] | None = Field(
@@ -48,6 +52,8 @@ class McpConfig(BaseModel):
         mcpServers: Dictionary mapping server names to their configurations
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     mcpServers: dict[str, ServerConfig] = Field(
         ..., description="Mapping of server names to configurations"
     )
@@ -94,6 +100,28 @@ class McpConfig(BaseModel):
         """
         return cls.model_validate(config_dict)
 
+    @classmethod
+    def from_trusted_dict(cls, config_dict: dict[str, Any]) -> "McpConfig":
+        """Create McpConfig from a dictionary without running validation.
+
+        Uses model_construct to bypass Pydantic validation entirely, which is
+        substantially faster than from_dict for small configs. Only use this
+        for configs produced by this tool itself (e.g., re-reading a config it
+        just wrote); the caller must guarantee the dictionary has the correct
+        shape, since malformed input will surface later as attribute errors.
+
+        Args:
+            config_dict: Dictionary containing already-validated configuration
+
+        Returns:
+            McpConfig instance (unvalidated)
+        """
+        servers = {
+            name: ServerConfig.model_construct(**server)
+            for name, server in config_dict["mcpServers"].items()
+        }
+        return cls.model_construct(mcpServers=servers)
+
     @classmethod
     def from_json(cls, json_str: str) -> "McpConfig":
         """Create McpConfig from a JSON string.
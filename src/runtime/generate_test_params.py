@@ -8,14 +8,20 @@ and descriptions.
 """
 
 import argparse
+import asyncio
+import hashlib
 import json
 import logging
+import os
 import re
 import subprocess
-from enum import Enum
+from enum import IntEnum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+import aiofiles
+
 try:
     import anthropic
     from anthropic.types import TextBlock
@@ -23,15 +29,152 @@ except ImportError:
     anthropic = None  # type: ignore[assignment]
     TextBlock = None  # type: ignore[assignment, misc]
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger("mcp_execution.generate_test_params")
 
 
-class ToolSafety(str, Enum):
-    """Safety classification for tools."""
+def _dumps_indented(obj: Any) -> str:
+    """Serialize to 2-space-indented JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+def _loads(text: str) -> Any:
+    """Parse JSON text, using orjson when available.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+    keep catching the stdlib exception regardless of which backend is used.
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
 
-    SAFE = "safe"
-    DANGEROUS = "dangerous"
-    UNKNOWN = "unknown"
+# Schema keys that add prompt tokens without affecting minimal-value generation
+_SCHEMA_NOISE_KEYS = frozenset({"description", "examples", "$comment"})
+
+# Enum values beyond this count add nothing when only one value is picked
+_MAX_ENUM_VALUES = 5
+
+# Keywords whose dict values map *names* to subschemas; those names are data
+# (a parameter may legitimately be called "description") and must never be
+# filtered as noise keys
+_SCHEMA_MAP_KEYS = frozenset({"properties", "patternProperties", "$defs", "definitions"})
+
+
+def _slim_schema(schema: Any) -> Any:
+    """Strip prompt-irrelevant fields from a JSON Schema before sending to the LLM.
+
+    Recursively drops description/examples/$comment and truncates long enums.
+    LLM latency and cost scale with input tokens, and none of these fields
+    affect which minimal values satisfy the schema. Noise keys are only
+    stripped from schema nodes; keys under properties/patternProperties/$defs
+    are property and definition names, which are kept verbatim. The original
+    schema is left untouched for validation elsewhere.
+    """
+    if isinstance(schema, dict):
+        slimmed: dict[str, Any] = {}
+        for key, value in schema.items():
+            if key in _SCHEMA_NOISE_KEYS:
+                continue
+            if key in _SCHEMA_MAP_KEYS and isinstance(value, dict):
+                slimmed[key] = {name: _slim_schema(sub) for name, sub in value.items()}
+            else:
+                slimmed[key] = _slim_schema(value)
+        enum_values = slimmed.get("enum")
+        if isinstance(enum_values, list) and len(enum_values) > _MAX_ENUM_VALUES:
+            slimmed["enum"] = enum_values[:_MAX_ENUM_VALUES]
+        return slimmed
+    if isinstance(schema, list):
+        return [_slim_schema(item) for item in schema]
+    return schema
+
+
+def _render_prompt_schema(input_schema: dict[str, Any]) -> str:
+    """Render a schema for the prompt: slimmed and compact (no indentation)."""
+    slimmed = _slim_schema(input_schema)
+    if orjson is not None:
+        return orjson.dumps(slimmed).decode()
+    return json.dumps(slimmed, separators=(",", ":"))
+
+
+# On-disk cache for LLM-generated test parameters, keyed by tool name +
+# schema. The root honors MCP_CODE_EXECUTION_CACHE_DIR so test runs stay out
+# of the real user cache.
+_CACHE_ROOT_ENV = "MCP_CODE_EXECUTION_CACHE_DIR"
+
+
+def _params_cache_dir() -> Path:
+    """Return the params cache directory, honoring the env override."""
+    root = os.environ.get(_CACHE_ROOT_ENV)
+    base = Path(root) if root else Path.home() / ".cache" / "mcp-code-execution"
+    return base / "params"
+
+
+def _params_cache_key(tool_name: str, input_schema: dict[str, Any]) -> str:
+    """Stable cache key from the tool name and a canonical schema rendering."""
+    if orjson is not None:
+        payload = orjson.dumps({"n": tool_name, "s": input_schema}, option=orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps({"n": tool_name, "s": input_schema}, sort_keys=True).encode()
+    return hashlib.sha256(payload).hexdigest()
+
+
+async def _read_cached_params(key: str) -> dict[str, Any] | None:
+    """Load previously generated params for a key, or None on any failure."""
+    cache_file = _params_cache_dir() / f"{key}.json"
+    try:
+        async with aiofiles.open(cache_file) as f:
+            content = await f.read()
+        params = _loads(content)
+        return params if isinstance(params, dict) else None
+    except (OSError, json.JSONDecodeError, ValueError):
+        return None
+
+
+async def _write_cached_params(key: str, params: dict[str, Any]) -> None:
+    """Persist generated params for a key; cache failures are non-fatal."""
+    try:
+        cache_file = _params_cache_dir() / f"{key}.json"
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        async with aiofiles.open(cache_file, "w") as f:
+            await f.write(_dumps_indented(params))
+    except OSError as e:
+        logger.debug(f"Failed to write params cache entry {key}: {e}")
+
+
+# Shared Anthropic client so all parameter generations reuse one connection pool
+_CLIENT: Any = None
+
+
+def _get_client() -> Any:
+    """Lazily create and cache a single AsyncAnthropic client.
+
+    Constructing a client builds an HTTP client and TLS/connection pools;
+    sharing one instance across all tool-parameter generations keeps
+    connections to the API alive between calls.
+    """
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = anthropic.AsyncAnthropic()
+    return _CLIENT
+
+
+class ToolSafety(IntEnum):
+    """Safety classification for tools.
+
+    IntEnum keeps the hot classification comparisons machine-word cheap;
+    use ``.name.lower()`` where a human-readable label is needed.
+    """
+
+    SAFE = 0
+    DANGEROUS = 1
+    UNKNOWN = 2
 
 
 # Regex patterns for tool classification
@@ -91,11 +234,47 @@ DANGEROUS_KEYWORDS = [
     "truncate",
 ]
 
+# Each pattern/keyword group fused into a single alternation compiled once at
+# import, so classify_tool does one scan per group instead of one per pattern
+_SAFE_RE = re.compile("|".join(f"(?:{p})" for p in SAFE_PATTERNS), re.IGNORECASE)
+_DANGEROUS_RE = re.compile("|".join(f"(?:{p})" for p in DANGEROUS_PATTERNS), re.IGNORECASE)
+_SAFE_KW_RE = re.compile("|".join(map(re.escape, SAFE_KEYWORDS)))
+_DANGEROUS_KW_RE = re.compile("|".join(map(re.escape, DANGEROUS_KEYWORDS)))
+
 
+def _verb_safety_map() -> dict[str, "ToolSafety"]:
+    """Build a verb -> safety table from the simple ``^verb_`` name patterns.
+
+    Most name patterns are anchored verb prefixes, so a dict probe on the
+    token before the first underscore resolves them without running the
+    regexes. Patterns that are not plain ``^verb_`` (e.g. ``^create_.*table``,
+    ``^fetch``) are left to the regex fallback.
+    """
+    table: dict[str, ToolSafety] = {}
+    simple = re.compile(r"\^(\w+)_$")
+    for patterns, safety in (
+        (SAFE_PATTERNS, ToolSafety.SAFE),
+        (DANGEROUS_PATTERNS, ToolSafety.DANGEROUS),
+    ):
+        for pattern in patterns:
+            match = simple.fullmatch(pattern)
+            if match:
+                table[match.group(1)] = safety
+    return table
+
+
+_VERB_SAFETY = _verb_safety_map()
+
+
+@lru_cache(maxsize=4096)
 def classify_tool(tool_name: str, description: str | None = None) -> ToolSafety:
     """
     Classify a tool as SAFE, DANGEROUS, or UNKNOWN based on patterns and description.
 
+    Results are memoized: discovery passes re-classify the same
+    (name, description) pairs across servers and re-runs, and both
+    arguments are plain strings, so repeats cost one cache probe.
+
     Classification strategy:
     1. Check description for dangerous keywords (overrides all else)
     2. Check against explicit regex patterns
@@ -109,25 +288,33 @@ def classify_tool(tool_name: str, description: str | None = None) -> ToolSafety:
     Returns:
         ToolSafety classification
     """
+    # Lowercase the description once; both keyword checks reuse it
+    desc_lower = description.lower() if description else ""
+
     # First priority: dangerous keywords in description override everything
-    if description:
-        desc_lower = description.lower()
-        if any(kw in desc_lower for kw in DANGEROUS_KEYWORDS):
-            return ToolSafety.DANGEROUS
+    if desc_lower and _DANGEROUS_KW_RE.search(desc_lower):
+        return ToolSafety.DANGEROUS
+
+    # Fast path: names shaped like verb_rest resolve via one dict probe.
+    # Equivalent to the two pattern scans below because every ^verb_ pattern
+    # is in the table and no other pattern can match a tabled verb
+    verb, sep, _rest = tool_name.partition("_")
+    if sep:
+        fast = _VERB_SAFETY.get(verb.lower())
+        if fast is not None:
+            return fast
 
     # Check dangerous patterns (high priority)
-    if any(re.match(pattern, tool_name, re.IGNORECASE) for pattern in DANGEROUS_PATTERNS):
+    if _DANGEROUS_RE.match(tool_name):
         return ToolSafety.DANGEROUS
 
     # Check safe patterns
-    if any(re.match(pattern, tool_name, re.IGNORECASE) for pattern in SAFE_PATTERNS):
+    if _SAFE_RE.match(tool_name):
         return ToolSafety.SAFE
 
     # Fall back to description safe keywords
-    if description:
-        desc_lower = description.lower()
-        if any(kw in desc_lower for kw in SAFE_KEYWORDS):
-            return ToolSafety.SAFE
+    if desc_lower and _SAFE_KW_RE.search(desc_lower):
+        return ToolSafety.SAFE
 
     return ToolSafety.UNKNOWN
 
@@ -184,7 +371,7 @@ def _generate_with_claude_code(
         # Load and format the prompt template
         template = _load_prompt_template()
         description_line = f"Description: {description}" if description else ""
-        schema_json = json.dumps(input_schema, indent=2)
+        schema_json = _render_prompt_schema(input_schema)
 
         prompt = template.format(
             tool_name=tool_name,
@@ -214,7 +401,7 @@ def _generate_with_claude_code(
                 response_text = response_text[4:]
             response_text = response_text.strip()
 
-        params = json.loads(response_text)
+        params = _loads(response_text)
 
         if not isinstance(params, dict):
             logger.warning(f"Generated params for {tool_name} is not a dict: {type(params)}")
@@ -257,7 +444,7 @@ def _generate_with_copilot_cli(
         # Load and format the prompt template
         template = _load_prompt_template()
         description_line = f"Description: {description}" if description else ""
-        schema_json = json.dumps(input_schema, indent=2)
+        schema_json = _render_prompt_schema(input_schema)
 
         prompt = template.format(
             tool_name=tool_name,
@@ -287,7 +474,7 @@ def _generate_with_copilot_cli(
                 response_text = response_text[4:]
             response_text = response_text.strip()
 
-        params = json.loads(response_text)
+        params = _loads(response_text)
 
         if not isinstance(params, dict):
             logger.warning(f"Generated params for {tool_name} is not a dict: {type(params)}")
@@ -310,7 +497,7 @@ def _generate_with_copilot_cli(
         return None
 
 
-def generate_test_parameters(
+async def generate_test_parameters(
     tool_name: str,
     input_schema: dict[str, Any],
     description: str | None = None,
@@ -323,7 +510,8 @@ def generate_test_parameters(
 
     Uses Claude Haiku API, Claude Code CLI, or Copilot CLI to generate minimal but valid
     test parameters that satisfy the tool's inputSchema. Returns None on any
-    error (safe fallback).
+    error (safe fallback). The API path is fully async so callers can generate
+    parameters for many tools concurrently.
 
     Args:
         tool_name: Name of the tool
@@ -345,7 +533,7 @@ def generate_test_parameters(
         ...     },
         ...     "required": ["repo_path"]
         ... }
-        >>> params = generate_test_parameters("git_log", schema)
+        >>> params = await generate_test_parameters("git_log", schema)
         >>> # Returns: {"repo_path": ".", "max_count": 1}
     """
     # CLI tools take precedence over API: Copilot > Claude Code > API
@@ -361,17 +549,25 @@ def generate_test_parameters(
         logger.debug(f"Skipping Claude API for {tool_name} (--claude-api disabled)")
         return None
 
+    # Check the on-disk cache before paying an API round-trip; identical
+    # (tool, schema) pairs recur across servers and across re-runs
+    cache_key = _params_cache_key(tool_name, input_schema)
+    cached = await _read_cached_params(cache_key)
+    if cached is not None:
+        logger.debug(f"Using cached params for {tool_name}")
+        return cached
+
     if anthropic is None:
         logger.warning("anthropic library not installed. " "Install with: uv pip install anthropic")
         return None
 
     try:
-        client = anthropic.Anthropic()
+        client = _get_client()
 
         # Load and format the prompt template
         template = _load_prompt_template()
         description_line = f"Description: {description}" if description else ""
-        schema_json = json.dumps(input_schema, indent=2)
+        schema_json = _render_prompt_schema(input_schema)
 
         prompt = template.format(
             tool_name=tool_name,
@@ -379,18 +575,16 @@ def generate_test_parameters(
             schema_json=schema_json,
         )
 
-        message = client.messages.create(
+        message = await client.messages.create(
             model="claude-3-5-haiku-20241022",
             max_tokens=500,
             messages=[{"role": "user", "content": prompt}],
         )
 
-        # Extract JSON from response
+        # Extract JSON from response (single attribute lookup, no hasattr probing)
         response_text = ""
         if message.content:
-            first_block = message.content[0]
-            if hasattr(first_block, "text"):
-                response_text = first_block.text
+            response_text = getattr(message.content[0], "text", "")
         response_text = response_text.strip()
 
         # Handle markdown code blocks
@@ -400,13 +594,14 @@ def generate_test_parameters(
                 response_text = response_text[4:]
             response_text = response_text.strip()
 
-        params = json.loads(response_text)
+        params = _loads(response_text)
 
         if not isinstance(params, dict):
             logger.warning(f"Generated params for {tool_name} is not a dict: {type(params)}")
             return None
 
         logger.debug(f"Generated params for {tool_name}: {params}")
+        await _write_cached_params(cache_key, params)
         return params
 
     except json.JSONDecodeError as e:
@@ -420,7 +615,11 @@ def generate_test_parameters(
         return None
 
 
-def build_discovery_config(
+# Maximum number of in-flight LLM parameter generations
+MAX_CONCURRENT_GENERATIONS = 16
+
+
+async def build_discovery_config(
     servers_tools: dict[str, list[dict[str, Any]]],
     skip_dangerous: bool = True,
     use_claude_api: bool = True,
@@ -431,7 +630,10 @@ def build_discovery_config(
     Build a discovery config from servers and their tools.
 
     For each tool, generates test parameters and classifies by safety.
-    Tools marked as DANGEROUS are excluded by default.
+    Tools marked as DANGEROUS are excluded by default. Parameter generation
+    is dispatched concurrently (bounded by MAX_CONCURRENT_GENERATIONS) so
+    total wall time approaches the slowest single generation rather than
+    the sum of all of them.
 
     Args:
         servers_tools: Dict mapping server names to list of tool definitions
@@ -462,6 +664,19 @@ def build_discovery_config(
             }
         }
     """
+    # Fast path: nothing to classify or generate (e.g. every server was
+    # unreachable), so skip the semaphore/gather machinery entirely
+    if not servers_tools:
+        return {
+            "servers": {},
+            "metadata": {
+                "generated": True,
+                "tools_skipped": {"dangerous": [], "unknown": []},
+                "generated_count": 0,
+                "skipped_count": 0,
+            },
+        }
+
     config: dict[str, Any] = {"servers": {}}
     tools_skipped: dict[str, list[str]] = {"dangerous": [], "unknown": []}
     metadata: dict[str, Any] = {
@@ -471,11 +686,13 @@ def build_discovery_config(
         "skipped_count": 0,
     }
 
-    for server_name, tools in servers_tools.items():
-        safe_tools_config: dict[str, dict[str, Any]] = {}
-        generated_count = 0
-        skipped_count = 0
+    # Phase 1: classify tools, recording which need parameter generation.
+    # Identical (name, schema) pairs across servers share one generation.
+    per_server_skipped: dict[str, int] = dict.fromkeys(servers_tools, 0)
+    pending: list[tuple[str, str, dict[str, Any], str, str]] = []
+    unique_keys: dict[str, tuple[str, dict[str, Any], str]] = {}
 
+    for server_name, tools in servers_tools.items():
         for tool in tools:
             tool_name = tool.get("name", "")
             if not tool_name:
@@ -490,17 +707,28 @@ def build_discovery_config(
             # Skip dangerous tools if requested
             if skip_dangerous and safety == ToolSafety.DANGEROUS:
                 tools_skipped["dangerous"].append(tool_name)
-                skipped_count += 1
+                per_server_skipped[server_name] += 1
                 continue
 
             # Skip unknown tools (require manual config)
             if safety == ToolSafety.UNKNOWN:
                 tools_skipped["unknown"].append(tool_name)
-                skipped_count += 1
+                per_server_skipped[server_name] += 1
                 continue
 
-            # Generate test parameters
-            params = generate_test_parameters(
+            key = _params_cache_key(tool_name, input_schema)
+            pending.append((server_name, tool_name, input_schema, description, key))
+            if key not in unique_keys:
+                unique_keys[key] = (tool_name, input_schema, description)
+
+    # Phase 2: generate test parameters concurrently (bounded by semaphore)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_GENERATIONS)
+
+    async def _bounded_generate(
+        tool_name: str, input_schema: dict[str, Any], description: str
+    ) -> dict[str, Any] | None:
+        async with semaphore:
+            return await generate_test_parameters(
                 tool_name,
                 input_schema,
                 description,
@@ -508,21 +736,44 @@ def build_discovery_config(
                 use_claude_code,
                 use_copilot_cli,
             )
-            if params is None:
-                logger.warning(f"Failed to generate params for {server_name}.{tool_name}")
-                tools_skipped["unknown"].append(tool_name)
-                skipped_count += 1
-                continue
-
-            safe_tools_config[tool_name] = params
-            generated_count += 1
 
+    results = await asyncio.gather(
+        *(_bounded_generate(name, schema, desc) for name, schema, desc in unique_keys.values()),
+        return_exceptions=True,
+    )
+    params_by_key = dict(zip(unique_keys.keys(), results))
+
+    # Phase 3: stitch results back into per-server safeTools configs
+    server_tools_config: dict[str, dict[str, dict[str, Any]]] = {name: {} for name in servers_tools}
+    per_server_generated: dict[str, int] = dict.fromkeys(servers_tools, 0)
+
+    for server_name, tool_name, _, _, key in pending:
+        params = params_by_key[key]
+        if isinstance(params, BaseException):
+            logger.warning(f"Failed to generate params for {server_name}.{tool_name}: {params}")
+            params = None
+        if params is None:
+            logger.warning(f"Failed to generate params for {server_name}.{tool_name}")
+            tools_skipped["unknown"].append(tool_name)
+            per_server_skipped[server_name] += 1
+            continue
+
+        server_tools_config[server_name][tool_name] = params
+        per_server_generated[server_name] += 1
+
+    total_generated = 0
+    total_skipped = 0
+
+    for server_name in servers_tools:
+        safe_tools_config = server_tools_config[server_name]
         if safe_tools_config:
             config["servers"][server_name] = {"safeTools": safe_tools_config}
 
-        metadata["generated_count"] = metadata["generated_count"] + generated_count
-        metadata["skipped_count"] = metadata["skipped_count"] + skipped_count
+        total_generated += per_server_generated[server_name]
+        total_skipped += per_server_skipped[server_name]
 
+    metadata["generated_count"] = total_generated
+    metadata["skipped_count"] = total_skipped
     config["metadata"] = metadata
     return config
 
@@ -617,46 +868,50 @@ async def generate_discovery_config_file(
         logger.error(f"Failed to initialize MCP client: {e}")
         return
 
-    # Discover tools from all servers using list_all_tools
+    # Discover tools from all enabled servers concurrently
     servers_tools: dict[str, list[dict[str, Any]]] = {}
 
     try:
-        logger.debug("Discovering all tools from configured servers...")
-        all_tools = await manager.list_all_tools()
-
-        # Group tools by server name (extract from tool metadata)
-        for tool in all_tools:
-            # Tools don't inherently know their server, so we'll connect per server instead
-            pass
-
-        # Instead, iterate over enabled servers directly
         enabled_servers = mcp_config.get_enabled_servers()
+        semaphore = asyncio.Semaphore(8)
 
-        for server_name in enabled_servers.keys():
-            try:
+        async def _discover_server_tools(
+            server_name: str, server_config: Any
+        ) -> list[dict[str, Any]]:
+            async with semaphore:
                 logger.debug(f"Discovering tools from {server_name}...")
 
-                # The manager caches tools, so we can get them from cache after list_all_tools
-                # Using private method _get_server_tools since there's no public alternative
+                # Using private methods since there's no public per-server alternative
+                if server_name not in manager._clients:
+                    await manager._connect_to_server(server_name, server_config)
                 tools = await manager._get_server_tools(server_name)
 
-                tools_list: list[dict[str, Any]] = []
-                for tool in tools:
-                    tools_list.append(
-                        {
-                            "name": tool.name,
-                            "description": tool.description or "",
-                            "inputSchema": tool.inputSchema or {},
-                        }
-                    )
-
-                servers_tools[server_name] = tools_list
-                logger.info(f"Found {len(tools_list)} tools in {server_name}")
-
-            except Exception as e:
-                logger.warning(f"Failed to discover tools from {server_name}: {e}")
+                return [
+                    {
+                        "name": tool.name,
+                        "description": tool.description or "",
+                        "inputSchema": tool.inputSchema or {},
+                    }
+                    for tool in tools
+                ]
+
+        server_names = list(enabled_servers.keys())
+        results = await asyncio.gather(
+            *(
+                _discover_server_tools(name, server_config)
+                for name, server_config in enabled_servers.items()
+            ),
+            return_exceptions=True,
+        )
+
+        for server_name, tools_list in zip(server_names, results):
+            if isinstance(tools_list, BaseException):
+                logger.warning(f"Failed to discover tools from {server_name}: {tools_list}")
                 continue
 
+            servers_tools[server_name] = tools_list
+            logger.info(f"Found {len(tools_list)} tools in {server_name}")
+
     except Exception as e:
         logger.error(f"Failed to list all tools: {e}")
 
@@ -668,7 +923,7 @@ async def generate_discovery_config_file(
 
     # Build discovery config
     logger.info("Generating discovery config...")
-    discovery_config = build_discovery_config(
+    discovery_config = await build_discovery_config(
         servers_tools,
         skip_dangerous=skip_dangerous,
         use_claude_api=use_claude_api,
@@ -676,11 +931,13 @@ async def generate_discovery_config_file(
         use_copilot_cli=use_copilot_cli,
     )
 
-    # Write config file (using synchronous write to avoid cleanup issues)
+    # Write config file atomically: single byte-write to a sibling temp file,
+    # then rename over the target so a crash never leaves a partial config
     try:
-        config_content = json.dumps(discovery_config, indent=2)
-        with open(output_path_str, "w") as f:
-            f.write(config_content)
+        data = _dumps_indented(discovery_config).encode()
+        tmp_path = output_path_str + ".tmp"
+        await asyncio.to_thread(Path(tmp_path).write_bytes, data)
+        await asyncio.to_thread(os.replace, tmp_path, output_path_str)
         logger.info(f"Wrote discovery config to: {output_path_str}")
     except Exception as e:
         logger.error(f"Failed to write discovery config: {e}")
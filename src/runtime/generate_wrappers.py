@@ -13,90 +13,193 @@ from typing import Any
 from .config import McpConfig
 from .schema_utils import (
     generate_pydantic_model,
+    json_schema_to_python_type,
     sanitize_name,
 )
 
 logger = logging.getLogger("mcp_execution.generate_wrappers")
 
+# Header for every generated tool file: one relative import instead of
+# re-declaring the same typing/pydantic/runtime imports in each module,
+# keeping per-module init work and global symbol tables small
+_IMPORTS_BLOCK = "from ._common import *  # noqa: F401,F403\n\n"
+
+# Names re-exported by each server package's _common.py. The leading
+# underscore on _normalize would normally hide it from a star import, so
+# __all__ lists it explicitly.
+_COMMON_EXPORTS = [
+    "Any",
+    "Awaitable",
+    "BaseModel",
+    "ConfigDict",
+    "Dict",
+    "Field",
+    "List",
+    "Literal",
+    "Optional",
+    "Sequence",
+    "TypedDict",
+    "Unpack",
+    "invoke_mcp_tool",
+    "_normalize",
+]
+
+
+def generate_common_module(server_name: str) -> str:
+    """
+    Generate the per-server ``_common.py`` shared-imports module.
+
+    Every tool file in a server package needs the same typing/pydantic
+    names plus the runtime call helper and the server's bound normalizer;
+    centralizing them here leaves each generated module with a single
+    import line.
+
+    Args:
+        server_name: Name of the MCP server
+
+    Returns:
+        Python code for the _common module
+    """
+    exports = "\n".join(f'    "{name}",' for name in _COMMON_EXPORTS)
+    return f'''"""Shared imports for generated {server_name} wrappers."""
+
+from typing import Any, Awaitable, Dict, List, Literal, Optional, Sequence, TypedDict, Unpack
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from runtime.mcp_client import invoke_mcp_tool
+from runtime.normalize_fields import get_normalizer
+
+# Normalization strategy resolved once for the whole server package
+_normalize = get_normalizer("{server_name}")
+
+__all__ = [
+{exports}
+]
+'''
+
+
+def params_model_name(safe_tool_name: str) -> str:
+    """Derive the Pydantic params model class name from a sanitized tool name."""
+    return f"{safe_tool_name.title().replace('_', '')}Params"
+
 
-def generate_tool_wrapper(server_name: str, tool_name: str, tool: Any) -> str:
+def kwargs_typeddict_name(safe_tool_name: str) -> str:
+    """Derive the kwargs TypedDict class name from a sanitized tool name."""
+    return f"{safe_tool_name.title().replace('_', '')}Kwargs"
+
+
+def generate_kwargs_typeddict(tool_name: str, tool: Any, typeddict_name: str) -> str:
+    """
+    Generate a TypedDict describing a tool's keyword arguments.
+
+    The TypedDict types the wrapper's **kwargs statically without paying a
+    BaseModel instantiation at call time.
+
+    Args:
+        tool_name: Name of the tool
+        tool: Tool definition from MCP
+        typeddict_name: Name of the TypedDict class (precomputed by the caller)
+
+    Returns:
+        Python code for the kwargs TypedDict
+    """
+    input_schema = getattr(tool, "inputSchema", {})
+    properties = input_schema.get("properties", {}) if input_schema else {}
+
+    lines = [
+        f"class {typeddict_name}(TypedDict, total=False):",
+        f'    """Keyword arguments for {tool_name}."""',
+    ]
+
+    if not properties:
+        lines.append("    pass")
+    else:
+        for field_name, field_schema in properties.items():
+            field_type = json_schema_to_python_type(field_schema, required=True)
+            lines.append(f"    {field_name}: {field_type}")
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_tool_wrapper(
+    server_name: str,
+    tool_name: str,
+    tool: Any,
+    safe_tool_name: str,
+    kwargs_typeddict: str,
+) -> str:
     """
     Generate Python wrapper function for a tool.
 
+    Wrappers take plain keyword arguments typed via a TypedDict: the values
+    are forwarded straight to the runtime, skipping the BaseModel
+    instantiation + model_dump round trip that a params-object signature
+    would pay on every call.
+
+    The wrapper is a plain ``def`` that tail-calls invoke_mcp_tool and
+    returns its coroutine: the body is a single await plus normalization,
+    so an ``async def`` frame would only add one more coroutine allocation
+    per call. Callers still just ``await`` the wrapper.
+
     Args:
         server_name: Name of the MCP server
         tool_name: Name of the tool
         tool: Tool definition from MCP
+        safe_tool_name: Sanitized tool name (precomputed by the caller)
+        kwargs_typeddict: Name of the kwargs TypedDict (precomputed by the caller)
 
     Returns:
         Python code for wrapper function
 
     Example output:
         ```python
-        async def git_status(params: GitStatusParams) -> Dict[str, Any]:
+        def git_status(**kwargs: Unpack[GitStatusKwargs]) -> Awaitable[Dict[str, Any]]:
             '''Get git repository status'''
-            from runtime.mcp_client import call_mcp_tool
-            from runtime.normalize_fields import normalize_field_names
-
-            result = await call_mcp_tool("git__git_status", params.model_dump())
-            normalized = normalize_field_names(result, "git")
-            return GitStatusResult.model_validate(normalized)
+            return invoke_mcp_tool("git__git_status", dict(kwargs), _normalize)
         ```
     """
-    safe_tool_name = sanitize_name(tool_name)
     tool_identifier = f"{server_name}__{tool_name}"
 
     # Get tool description
     description = getattr(tool, "description", "MCP tool wrapper")
     description_escaped = description.replace('"""', '\\"\\"\\"')
 
-    # Generate parameter model name
-    params_model = f"{safe_tool_name.title().replace('_', '')}Params"
-
     # Generate wrapper function
     wrapper = f'''
-async def {safe_tool_name}(params: {params_model}) -> Dict[str, Any]:
+def {safe_tool_name}(**kwargs: Unpack[{kwargs_typeddict}]) -> Awaitable[Dict[str, Any]]:
     """
     {description_escaped}
 
     Args:
-        params: Tool parameters
+        **kwargs: Tool parameters (see {kwargs_typeddict})
 
     Returns:
-        Tool execution result
+        Awaitable resolving to the tool execution result
     """
-    from runtime.mcp_client import call_mcp_tool
-    from runtime.normalize_fields import normalize_field_names
-
-    # Call tool
-    result = await call_mcp_tool("{tool_identifier}", params.model_dump(exclude_none=True))
-
-    # Defensive unwrapping
-    unwrapped = getattr(result, "value", result)
-
-    # Apply field normalization
-    normalized = normalize_field_names(unwrapped, "{server_name}")
-
-    return normalized
+    # Tail-call the runtime coroutine (None-valued kwargs stay off the wire);
+    # normalization happens inside invoke_mcp_tool, so no async frame is
+    # needed here
+    return invoke_mcp_tool(
+        "{tool_identifier}", {{k: v for k, v in kwargs.items() if v is not None}}, _normalize
+    )
 '''
 
     return wrapper
 
 
-def generate_params_model(tool_name: str, tool: Any) -> str:
+def generate_params_model(tool_name: str, tool: Any, model_name: str) -> str:
     """
     Generate Pydantic model for tool parameters.
 
     Args:
         tool_name: Name of the tool
         tool: Tool definition from MCP
+        model_name: Name of the params model class (precomputed by the caller)
 
     Returns:
         Python code for Pydantic params model
     """
-    safe_tool_name = sanitize_name(tool_name)
-    model_name = f"{safe_tool_name.title().replace('_', '')}Params"
-
     # Get input schema
     input_schema = getattr(tool, "inputSchema", {})
 
@@ -105,14 +208,102 @@ def generate_params_model(tool_name: str, tool: Any) -> str:
         return f'''
 class {model_name}(BaseModel):
     """Parameters for {tool_name}."""
-    pass
+
+    model_config = ConfigDict(defer_build=True, frozen=True, extra="forbid")
+
+    @classmethod
+    def build(cls, **kwargs: Any) -> "{model_name}":
+        """Construct without validation (trusted callers only)."""
+        return cls.model_construct(**kwargs)
 '''
 
     description = f"Parameters for {tool_name}"
     return generate_pydantic_model(model_name, input_schema, description)
 
 
-def generate_server_module(server_name: str, tools: list[Any], output_dir: Path) -> None:
+def generate_batch_helper(server_name: str, batch_name: str) -> str:
+    """
+    Generate the per-server batch dispatcher.
+
+    Independent tool calls against the same server are I/O bound, so firing
+    them concurrently costs max(t_i) instead of sum(t_i) round trips.
+
+    Args:
+        server_name: Name of the MCP server
+        batch_name: Sanitized function name for the dispatcher
+
+    Returns:
+        Python code for the batch helper module
+    """
+    return f'''import asyncio
+import os
+from typing import Tuple
+
+from ._common import *  # noqa: F401,F403
+
+# Cap in-flight calls: servers that spawn a subprocess per tool call thrash
+# disk and scheduler when an agent batches aggressively, so default to
+# roughly three quarters of the local cores
+_DEFAULT_MAX_CONCURRENT = max(2, int((os.cpu_count() or 4) * 0.75))
+
+
+async def {batch_name}(
+    calls: List[Tuple[str, Dict[str, Any]]],
+    max_concurrent: Optional[int] = None,
+) -> List[Any]:
+    """
+    Execute several {server_name} tools concurrently.
+
+    Args:
+        calls: (tool_name, params) pairs, e.g. [("git_status", {{"repo_path": "."}})]
+        max_concurrent: Cap on in-flight calls (defaults to ~3/4 of CPUs)
+
+    Returns:
+        Results in call order, each normalized like a single-tool call;
+        failed calls yield their exception instead of raising
+    """
+    semaphore = asyncio.Semaphore(max_concurrent or _DEFAULT_MAX_CONCURRENT)
+
+    async def _bounded(name: str, args: Dict[str, Any]) -> Any:
+        async with semaphore:
+            return await invoke_mcp_tool(f"{server_name}__{{name}}", args, _normalize)
+
+    results = await asyncio.gather(
+        *(_bounded(name, args) for name, args in calls),
+        return_exceptions=True,
+    )
+    return list(results)
+'''
+
+
+def _render_tool(server_name: str, tool: Any, server_dir: Path) -> tuple[Path, str]:
+    """Render one tool's generated source file (pure CPU, thread-safe)."""
+    tool_name = sanitize_name(tool.name)
+    tool_file = server_dir / f"{tool_name}.py"
+
+    # Generate models and wrapper (names computed once, passed through).
+    # The params model is still emitted for callers that want validation or
+    # build(); the wrapper itself goes through the kwargs TypedDict.
+    model_name = params_model_name(tool_name)
+    typeddict_name = kwargs_typeddict_name(tool_name)
+    params_model = generate_params_model(tool.name, tool, model_name)
+    kwargs_typeddict = generate_kwargs_typeddict(tool.name, tool, typeddict_name)
+    wrapper_func = generate_tool_wrapper(server_name, tool.name, tool, tool_name, typeddict_name)
+
+    tool_code = "".join((_IMPORTS_BLOCK, params_model, "\n\n", kwargs_typeddict, wrapper_func))
+    return tool_file, tool_code
+
+
+async def _write_file(path: Path, content: str) -> None:
+    """Write a single generated file asynchronously."""
+    import aiofiles
+
+    async with aiofiles.open(path, "w") as f:
+        await f.write(content)
+    logger.debug(f"Generated: {path}")
+
+
+async def generate_server_module(server_name: str, tools: list[Any], output_dir: Path) -> None:
     """
     Generate complete module for a server's tools.
 
@@ -121,6 +312,9 @@ def generate_server_module(server_name: str, tools: list[Any], output_dir: Path)
     - Barrel export (__init__.py)
     - README.md
 
+    All files are rendered first, then written concurrently so file I/O
+    does not block the event loop one syscall at a time.
+
     Args:
         server_name: Name of the MCP server
         tools: List of tool definitions
@@ -131,37 +325,33 @@ def generate_server_module(server_name: str, tools: list[Any], output_dir: Path)
 
     logger.info(f"Generating wrappers for server: {server_name} ({len(tools)} tools)")
 
-    imports = [
-        "from typing import Any, Dict, List, Optional",
-        "from pydantic import BaseModel, Field",
-        "from typing import Literal",
-    ]
-
-    tool_names = []
+    tool_names = [sanitize_name(tool.name) for tool in tools]
 
-    for tool in tools:
-        tool_name = sanitize_name(tool.name)
-        tool_names.append(tool_name)
+    # Rendering is pure string work; push it off the event loop and across
+    # cores while other servers' I/O proceeds
+    writes: list[tuple[Path, str]] = list(
+        await asyncio.gather(
+            *(asyncio.to_thread(_render_tool, server_name, tool, server_dir) for tool in tools)
+        )
+    )
 
-        # Generate tool file
-        tool_file = server_dir / f"{tool_name}.py"
+    # Shared-imports module every tool file pulls from
+    common_file = server_dir / "_common.py"
+    writes.append((common_file, generate_common_module(server_name)))
 
-        # Generate models and wrapper
-        params_model = generate_params_model(tool.name, tool)
-        wrapper_func = generate_tool_wrapper(server_name, tool.name, tool)
-
-        # Write tool file
-        tool_code = "\n".join(imports) + "\n\n" + params_model + "\n" + wrapper_func
-
-        tool_file.write_text(tool_code)
-        logger.debug(f"Generated: {tool_file}")
+    # Generate batch dispatcher (concurrent multi-tool execution)
+    batch_name = f"{sanitize_name(server_name)}_batch"
+    batch_file = server_dir / "batch.py"
+    writes.append((batch_file, generate_batch_helper(server_name, batch_name)))
 
     # Generate __init__.py (barrel export)
     init_file = server_dir / "__init__.py"
-    init_imports = [f"from .{name} import {name}" for name in tool_names]
-    init_all = f"__all__ = {tool_names}"
-    init_content = "\n".join(init_imports) + "\n\n" + init_all
-    init_file.write_text(init_content)
+    exported_names = tool_names + [batch_name]
+    init_content = "\n".join(
+        [f"from .{name} import {name}" for name in tool_names]
+        + [f"from .batch import {batch_name}", "", f"__all__ = {exported_names}"]
+    )
+    writes.append((init_file, init_content))
 
     # Generate README.md
     readme_file = server_dir / "README.md"
@@ -181,13 +371,44 @@ Auto-generated wrappers for {server_name} MCP server.
 ```python
 from servers.{server_name} import {tool_names[0] if tool_names else 'tool_name'}
 
-# Use the tool
-result = await {tool_names[0] if tool_names else 'tool_name'}(params)
+# Use the tool (parameters are plain keyword arguments)
+result = await {tool_names[0] if tool_names else 'tool_name'}(**params)
 ```
 
 **Note**: This file is auto-generated. Do not edit manually.
 """
-    readme_file.write_text(readme_content)
+    writes.append((readme_file, readme_content))
+
+    # Flush all generated files in one concurrent batch
+    await asyncio.gather(*(_write_file(path, content) for path, content in writes))
+
+
+async def _discover_and_generate(
+    manager: Any, server_name: str, server_config: Any, output_dir: Path
+) -> None:
+    """
+    Connect to a single server via the shared manager and generate its wrappers.
+
+    The manager owns connection lifecycle and tool caching, so the same
+    subprocess/session can be reused for any later per-tool RPC instead of
+    re-handshaking.
+
+    Args:
+        manager: Shared McpClientManager (already initialized)
+        server_name: Name of the MCP server
+        server_config: ServerConfig for the server
+        output_dir: Output directory (servers/)
+    """
+    logger.info(f"Connecting to server: {server_name}")
+
+    # Using private methods since there's no public per-server alternative
+    if server_name not in manager._clients:
+        await manager._connect_to_server(server_name, server_config)
+    tools = await manager._get_server_tools(server_name)
+    logger.info(f"Found {len(tools)} tools for {server_name}")
+
+    # Generate wrappers
+    await generate_server_module(server_name, tools, output_dir)
 
 
 async def generate_wrappers(config_path: Path | None = None) -> None:
@@ -195,7 +416,7 @@ async def generate_wrappers(config_path: Path | None = None) -> None:
     Main wrapper generation orchestrator.
 
     1. Load mcp_config.json
-    2. For each server:
+    2. For all servers concurrently:
        a. Connect and list tools
        b. Generate wrappers
        c. Write to servers/{server}/
@@ -213,8 +434,8 @@ async def generate_wrappers(config_path: Path | None = None) -> None:
         return
 
     import aiofiles
-    from mcp import ClientSession, StdioServerParameters
-    from mcp.client.stdio import stdio_client
+
+    from .mcp_client import McpClientManager
 
     async with aiofiles.open(config_file) as f:
         content = await f.read()
@@ -224,36 +445,27 @@ async def generate_wrappers(config_path: Path | None = None) -> None:
     output_dir = Path(__file__).parent.parent.parent / "servers"
     output_dir.mkdir(exist_ok=True)
 
-    # Generate for each server
-    for server_name, server_config in config.mcpServers.items():
-        try:
-            logger.info(f"Connecting to server: {server_name}")
-
-            # Create stdio server parameters
-            server_params = StdioServerParameters(
-                command=server_config.command,
-                args=server_config.args,
-                env=server_config.env,
-            )
-
-            # Connect and list tools using proper context manager pattern
-            async with stdio_client(server_params) as (read, write):
-                async with ClientSession(read, write) as session:
-                    await session.initialize()
-
-                    # List tools
-                    tools_response = await session.list_tools()
-                    tools = tools_response.tools
-                    logger.info(f"Found {len(tools)} tools for {server_name}")
-
-                    # Generate wrappers
-                    generate_server_module(server_name, tools, output_dir)
-
-        except Exception as e:
-            logger.error(f"Failed to generate wrappers for {server_name}: {e}")
-            import traceback
-
-            traceback.print_exc()
+    # One shared manager owns all server connections; discovery still fans out
+    # in parallel, so total wall time is bounded by the slowest server
+    manager = McpClientManager()
+    await manager.initialize(config_file)
+
+    try:
+        enabled_servers = config.get_enabled_servers()
+        server_names = list(enabled_servers.keys())
+        results = await asyncio.gather(
+            *(
+                _discover_and_generate(manager, name, server_config, output_dir)
+                for name, server_config in enabled_servers.items()
+            ),
+            return_exceptions=True,
+        )
+
+        for server_name, result in zip(server_names, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to generate wrappers for {server_name}: {result}")
+    finally:
+        await manager.cleanup()
 
     logger.info("Wrapper generation complete!")
 
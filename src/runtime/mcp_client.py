@@ -6,17 +6,20 @@ an explicit state machine pattern for clarity and debugging.
 """
 
 import asyncio
+import hashlib
 import json
 import logging
-from enum import Enum
-from functools import lru_cache
+import os
+import pickle
+from collections.abc import Callable
+from contextlib import AsyncExitStack
+from enum import IntEnum
 from pathlib import Path
 from typing import Any
 
-import aiofiles
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
-from mcp.types import Tool
+from mcp.types import CallToolResult, TextContent, Tool
 
 from .config import McpConfig, ServerConfig
 from .exceptions import (
@@ -26,21 +29,105 @@ from .exceptions import (
     ToolNotFoundError,
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger("mcp_execution.client")
 
+if orjson is not None:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so existing
+    # except clauses keep working
+    _loads = orjson.loads
+else:
+    _loads = json.loads
+
+# Warm-start cache of validated configs, keyed by config path and guarded by
+# mtime, so back-to-back harness invocations skip JSON parsing and Pydantic
+# validation. Lives next to the params cache used by discovery. The root is
+# overridable via MCP_CODE_EXECUTION_CACHE_DIR so test runs stay out of the
+# real user cache.
+_CACHE_ROOT_ENV = "MCP_CODE_EXECUTION_CACHE_DIR"
+
+
+def _config_cache_dir() -> Path:
+    """Return the config cache directory, honoring the env override."""
+    root = os.environ.get(_CACHE_ROOT_ENV)
+    base = Path(root) if root else Path.home() / ".cache" / "mcp-code-execution"
+    return base / "config"
+
+
+def _config_cache_path(config_file: Path) -> Path:
+    """Return the pickle cache path for a config file.
+
+    The key hashes the resolved path so the same relative path passed from
+    different working directories never shares a cache entry.
+    """
+    digest = hashlib.sha256(str(config_file.resolve()).encode()).hexdigest()[:16]
+    return _config_cache_dir() / f"{digest}.pkl"
+
+
+def _read_config_cache(config_file: Path) -> "McpConfig | None":
+    """Load a cached validated config if it is at least as new as the source."""
+    cache_path = _config_cache_path(config_file)
+    try:
+        if cache_path.stat().st_mtime >= config_file.stat().st_mtime:
+            cached = pickle.loads(cache_path.read_bytes())
+            if isinstance(cached, McpConfig):
+                return cached
+    except (OSError, pickle.PickleError, EOFError):
+        pass
+    return None
+
+
+def _write_config_cache(config_file: Path, config: "McpConfig") -> None:
+    """Persist a validated config; failures only cost the warm start."""
+    cache_path = _config_cache_path(config_file)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        tmp_path.write_bytes(pickle.dumps(config))
+        os.replace(tmp_path, cache_path)
+    except (OSError, pickle.PickleError):
+        logger.debug(f"Could not write config cache for {config_file}")
+
+
+# Sentinel distinguishing "attribute missing" from falsy attribute values
+_MISSING = object()
+
+_WS = frozenset(" \t\r\n")
+
+
+def _looks_like_json(text: str) -> bool:
+    """Check whether text starts (after whitespace) with a JSON object/array.
 
-class ConnectionState(Enum):
+    Scans character by character instead of str.strip(), which would copy
+    the whole payload just to inspect its first meaningful character.
+    """
+    for ch in text:
+        if ch in _WS:
+            continue
+        return ch == "{" or ch == "["
+    return False
+
+
+class ConnectionState(IntEnum):
     """Explicit states for the MCP Client Manager lifecycle.
 
+    Values are ordered so state progression can be compared directly
+    (e.g. ``self._state < ConnectionState.INITIALIZED``) without an
+    auxiliary ordering list.
+
     States:
         UNINITIALIZED: Manager created but not initialized
         INITIALIZED: Configuration loaded, no server connections
         CONNECTED: At least one server connection established
     """
 
-    UNINITIALIZED = "uninitialized"
-    INITIALIZED = "initialized"
-    CONNECTED = "connected"
+    UNINITIALIZED = 0
+    INITIALIZED = 1
+    CONNECTED = 2
 
 
 class McpClientManager:
@@ -64,22 +151,32 @@ class McpClientManager:
         _clients: Mapping of server names to active client sessions
         _tool_cache: Cached tools per server to avoid repeated queries
         _config: Loaded MCP configuration
-        _stdio_contexts: Stdio context managers for proper lifecycle management
-        _session_contexts: Session context managers for proper lifecycle management
-        _read_streams: Active stdio read streams
-        _write_streams: Active stdio write streams
+        _exit_stack: AsyncExitStack owning every entered stdio/session context
     """
 
+    # Fixed-offset attribute storage: call_tool touches these thousands of
+    # times per script, and slots skip the per-access __dict__ lookup
+    __slots__ = (
+        "_state",
+        "_clients",
+        "_tool_cache",
+        "_tool_name_set",
+        "_verified_tools",
+        "_config",
+        "_enabled_servers",
+        "_exit_stack",
+    )
+
     def __init__(self) -> None:
         """Initialize an uninitialized MCP Client Manager."""
         self._state: ConnectionState = ConnectionState.UNINITIALIZED
         self._clients: dict[str, ClientSession] = {}
         self._tool_cache: dict[str, list[Tool]] = {}
+        self._tool_name_set: dict[str, frozenset[str]] = {}
+        self._verified_tools: dict[str, set[str]] = {}
         self._config: McpConfig | None = None
-        self._stdio_contexts: dict[str, Any] = {}  # Store stdio context managers
-        self._session_contexts: dict[str, Any] = {}  # Store session context managers
-        self._read_streams: dict[str, Any] = {}
-        self._write_streams: dict[str, Any] = {}
+        self._enabled_servers: dict[str, ServerConfig] = {}
+        self._exit_stack: AsyncExitStack | None = None
 
     def _validate_state(self, required_state: ConnectionState, operation: str) -> None:
         """Validate that the manager is in the required state for an operation.
@@ -91,10 +188,10 @@ class McpClientManager:
         Raises:
             ConfigurationError: If the manager is not in the required state
         """
-        if self._state.value != required_state.value:
+        if self._state != required_state:
             raise ConfigurationError(
-                f"Cannot {operation}: Manager is in state '{self._state.value}', "
-                f"but requires state '{required_state.value}'"
+                f"Cannot {operation}: Manager is in state '{self._state.name.lower()}', "
+                f"but requires state '{required_state.name.lower()}'"
             )
 
     def _validate_state_at_least(self, minimum_state: ConnectionState, operation: str) -> None:
@@ -107,18 +204,10 @@ class McpClientManager:
         Raises:
             ConfigurationError: If the manager has not reached the minimum state
         """
-        state_order = [
-            ConnectionState.UNINITIALIZED,
-            ConnectionState.INITIALIZED,
-            ConnectionState.CONNECTED,
-        ]
-        current_idx = state_order.index(self._state)
-        required_idx = state_order.index(minimum_state)
-
-        if current_idx < required_idx:
+        if self._state < minimum_state:
             raise ConfigurationError(
-                f"Cannot {operation}: Manager is in state '{self._state.value}', "
-                f"but requires at least state '{minimum_state.value}'"
+                f"Cannot {operation}: Manager is in state '{self._state.name.lower()}', "
+                f"but requires at least state '{minimum_state.name.lower()}'"
             )
 
     def _mark_initialized(self) -> None:
@@ -137,35 +226,56 @@ class McpClientManager:
         self._state = ConnectionState.UNINITIALIZED
         logger.debug("State transition: -> UNINITIALIZED")
 
-    async def initialize(self, config_path: Path | None = None) -> None:
+    async def initialize(self, config_path: Path | None = None, eager: bool = False) -> None:
         """Initialize the manager by loading configuration.
 
         This method loads the MCP configuration from a JSON file but does NOT
-        establish any server connections. Connections are established lazily
-        on the first tool call.
+        establish any server connections by default. Connections are
+        established lazily on the first tool call.
+
+        With eager=True, all enabled servers are connected concurrently (and
+        their tool lists cached) as part of initialization, hiding the stdio
+        spawn + handshake latency that the first call_tool per server would
+        otherwise pay on the caller's critical path.
 
         Args:
             config_path: Optional path to mcp_config.json. If not provided,
                         defaults to mcp_config.json in the current directory
+            eager: Pre-connect to all enabled servers instead of lazily
 
         Raises:
             ConfigurationError: If config file is missing, malformed, or invalid
         """
         self._validate_state(ConnectionState.UNINITIALIZED, "initialize")
 
+        # One stack owns the lifetime of every connection's context managers;
+        # cleanup() closes them all with a single aclose()
+        self._exit_stack = AsyncExitStack()
+
         config_file = config_path or Path.cwd() / "mcp_config.json"
 
         if not config_file.exists():
             raise ConfigurationError(f"Config file not found: {config_file}")
 
         try:
-            async with aiofiles.open(config_file) as f:
-                content = await f.read()
-            self._config = McpConfig.model_validate_json(content)
-            enabled_count = len(self._config.get_enabled_servers())
+            # Warm start: reuse the pickled, already-validated config when the
+            # source file has not changed since it was cached
+            cached_config = _read_config_cache(config_file)
+            if cached_config is not None:
+                logger.debug(f"Loaded config from cache for {config_file}")
+                self._config = cached_config
+            else:
+                # Read synchronously: the config is a tiny local file, and the
+                # executor round-trip aiofiles would pay costs more than the read
+                content = config_file.read_text(encoding="utf-8")
+                self._config = McpConfig.model_validate_json(content)
+                _write_config_cache(config_file, self._config)
+            # Precompute the enabled-server map once; call_tool and
+            # list_all_tools hit it on every invocation
+            self._enabled_servers = self._config.get_enabled_servers()
             logger.info(
                 f"Configuration loaded: {len(self._config.mcpServers)} servers total, "
-                f"{enabled_count} enabled"
+                f"{len(self._enabled_servers)} enabled"
             )
             self._mark_initialized()
         except json.JSONDecodeError as e:
@@ -173,6 +283,14 @@ class McpClientManager:
         except Exception as e:
             raise ConfigurationError(f"Failed to load config from {config_file}: {e}")
 
+        if eager and self._config is not None:
+            # Warm every enabled server (connection + tool cache) concurrently;
+            # failures are logged per server and retried lazily on first use
+            logger.info("Eagerly connecting to all enabled servers")
+            async with asyncio.TaskGroup() as tg:
+                for server_name, server_config in self._enabled_servers.items():
+                    tg.create_task(self._connect_and_list(server_name, server_config))
+
     async def _connect_to_server(self, server_name: str, config: ServerConfig) -> None:
         """Establish connection to a single MCP server on-demand.
 
@@ -192,6 +310,9 @@ class McpClientManager:
 
         logger.info(f"Connecting to MCP server: {server_name}")
 
+        if self._exit_stack is None:
+            raise ServerConnectionError(f"Manager not initialized; cannot connect to {server_name}")
+
         try:
             # Create stdio server parameters
             server_params = StdioServerParameters(
@@ -200,37 +321,28 @@ class McpClientManager:
                 env=config.env,
             )
 
-            # Establish stdio connection and store the context manager
-            # We manually enter the context and store it for proper cleanup later
-            stdio_ctx = stdio_client(server_params)
-            streams = await stdio_ctx.__aenter__()
-            read_stream, write_stream = streams
-
-            # Store the context manager so we can properly exit it during cleanup
-            self._stdio_contexts[server_name] = stdio_ctx
-            self._read_streams[server_name] = read_stream
-            self._write_streams[server_name] = write_stream
+            # Enter both context managers on a connection-local stack first:
+            # if the handshake fails, the async with tears down whatever was
+            # entered so a half-connected subprocess is not left behind
+            async with AsyncExitStack() as conn_stack:
+                read_stream, write_stream = await conn_stack.enter_async_context(
+                    stdio_client(server_params)
+                )
+                client = await conn_stack.enter_async_context(
+                    ClientSession(read_stream, write_stream)
+                )
+                await client.initialize()
+
+                # Success: hand ownership of the contexts to the manager-wide
+                # stack so cleanup() closes them all in one aclose()
+                self._exit_stack.push_async_callback(conn_stack.pop_all().aclose)
 
-            # Create and initialize session, also storing its context manager
-            session = ClientSession(read_stream, write_stream)
-            client = await session.__aenter__()
-            await client.initialize()
-
-            # Store both the client and its context manager for proper cleanup
             self._clients[server_name] = client
-            self._session_contexts[server_name] = session
             self._mark_connected()
             logger.info(f"Successfully connected to server: {server_name}")
 
         except Exception as e:
             logger.error(f"Failed to connect to server '{server_name}': {e}")
-            # Clean up any partially created contexts
-            if server_name in self._stdio_contexts:
-                try:
-                    await self._stdio_contexts[server_name].__aexit__(None, None, None)
-                except Exception:
-                    pass
-                del self._stdio_contexts[server_name]
             raise ServerConnectionError(f"Could not connect to MCP server '{server_name}': {e}")
 
     async def _get_server_tools(self, server_name: str) -> list[Tool]:
@@ -262,8 +374,9 @@ class McpClientManager:
             # Defensive unwrapping: handle response.tools
             tools: list[Tool] = result.tools if hasattr(result, "tools") else []
 
-            # Cache the results
+            # Cache the results, plus a name set for O(1) lookups in call_tool
             self._tool_cache[server_name] = tools
+            self._tool_name_set[server_name] = frozenset(tool.name for tool in tools)
             logger.debug(f"Cached {len(tools)} tools for server: {server_name}")
 
             return tools
@@ -307,78 +420,114 @@ class McpClientManager:
 
         server_name, tool_name = tool_identifier.split("__", 1)
 
-        # Get server configuration
-        server_config = self._config.get_server(server_name)
-        if not server_config:
+        # Get server configuration: one lookup in the precomputed enabled map
+        # covers both "unknown" and "disabled"; the split error messages are
+        # only reconstructed on the failure path
+        server_config = self._enabled_servers.get(server_name)
+        if server_config is None:
+            if self._config.get_server(server_name) is not None:
+                raise ToolNotFoundError(f"Server '{server_name}' is disabled in configuration")
             raise ToolNotFoundError(
                 f"Server '{server_name}' not found in configuration. "
                 f"Available servers: {list(self._config.mcpServers.keys())}"
             )
 
-        if server_config.disabled:
-            raise ToolNotFoundError(f"Server '{server_name}' is disabled in configuration")
-
         # Lazy connection: connect to server if not already connected
         if server_name not in self._clients:
             logger.debug(f"Lazy connecting to server '{server_name}' for tool '{tool_name}'")
             await self._connect_to_server(server_name, server_config)
 
-        # Verify tool exists on server
-        tools = await self._get_server_tools(server_name)
-        tool_names = [tool.name for tool in tools]
+        # Verify tool exists on server. Tools that have already executed
+        # successfully skip the check entirely — MCP tool sets are static per
+        # session, so re-validating the same name every call is pure overhead
+        if tool_name not in self._verified_tools.get(server_name, ()):
+            tools = await self._get_server_tools(server_name)
 
-        if tool_name not in tool_names:
-            raise ToolNotFoundError(
-                f"Tool '{tool_name}' not found on server '{server_name}'. "
-                f"Available tools: {tool_names}"
-            )
+            if tool_name not in self._tool_name_set.get(server_name, frozenset()):
+                raise ToolNotFoundError(
+                    f"Tool '{tool_name}' not found on server '{server_name}'. "
+                    f"Available tools: {[tool.name for tool in tools]}"
+                )
 
         # Execute the tool
         try:
             client = self._clients[server_name]
             logger.info(f"Executing tool: {tool_identifier}")
-            logger.debug(f"Tool parameters: {params}")
+            # Guard: params can be large, and the f-string would render even
+            # with debug logging off
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Tool parameters: %s", params)
 
             result = await client.call_tool(tool_name, params)
+            self._verified_tools.setdefault(server_name, set()).add(tool_name)
 
-            # Defensive unwrapping: try multiple strategies to get the actual result
-            # 1. Try result.value (most common)
-            if hasattr(result, "value"):
-                unwrapped = result.value
-            # 2. Try result.content (alternative response format)
-            elif hasattr(result, "content"):
-                unwrapped = result.content
-            # 3. Fall back to result itself
+            # Defensive unwrapping: dispatch on the known response type first
+            # (a C-level isinstance check), then fall back to attribute probes
+            # for exotic response shapes
+            if isinstance(result, CallToolResult):
+                unwrapped: Any = result.content
             else:
-                unwrapped = result
+                # 1. Try result.value, 2. result.content, 3. the result itself
+                unwrapped = getattr(result, "value", _MISSING)
+                if unwrapped is _MISSING:
+                    unwrapped = getattr(result, "content", _MISSING)
+                if unwrapped is _MISSING:
+                    unwrapped = result
 
             # Additional unwrapping for text responses
             if isinstance(unwrapped, list) and len(unwrapped) > 0:
                 first_item = unwrapped[0]
-                if hasattr(first_item, "text"):
+                if isinstance(first_item, TextContent) or hasattr(first_item, "text"):
                     text_content = first_item.text
                     # Try to parse as JSON if it looks like JSON
-                    if isinstance(text_content, str) and text_content.strip().startswith(
-                        ("{", "[")
-                    ):
+                    if isinstance(text_content, str) and _looks_like_json(text_content):
                         try:
-                            return json.loads(text_content)
+                            return _loads(text_content)
                         except json.JSONDecodeError:
                             return text_content
                     return text_content
 
-            logger.debug(f"Tool execution result: {unwrapped}")
+            # Guard: tool responses can run to megabytes; skip the repr
+            # entirely unless debug logging is on
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Tool execution result: %s", unwrapped)
             return unwrapped
 
         except Exception as e:
             logger.error(f"Tool execution failed for '{tool_identifier}': {e}")
             raise ToolExecutionError(f"Failed to execute tool '{tool_identifier}': {e}")
 
+    async def _connect_and_list(self, server_name: str, config: ServerConfig) -> list[Tool]:
+        """Connect to a server (if needed) and return its tools.
+
+        Errors are logged and swallowed here so that one failing server does
+        not cancel the concurrent discovery of its siblings.
+
+        Args:
+            server_name: Name of the server
+            config: Server configuration
+
+        Returns:
+            Tools from the server, or an empty list on failure
+        """
+        try:
+            if server_name not in self._clients:
+                await self._connect_to_server(server_name, config)
+            tools = await self._get_server_tools(server_name)
+            logger.debug(f"Server '{server_name}': {len(tools)} tools")
+            return tools
+        except Exception as e:
+            logger.error(f"Failed to list tools from server '{server_name}': {e}")
+            # Continue with other servers rather than failing completely
+            return []
+
     async def list_all_tools(self) -> list[Tool]:
         """List all available tools from all enabled servers.
 
-        This method connects to all enabled servers to retrieve their tool lists.
-        Results are cached per server to avoid repeated queries.
+        Servers are connected concurrently: stdio spawn and MCP handshake are
+        pure I/O wait, so fanning out with a TaskGroup bounds wall time by the
+        slowest server instead of the sum of all handshakes. Results are
+        cached per server to avoid repeated queries.
 
         Returns:
             List of all available tools across all enabled servers
@@ -393,7 +542,7 @@ class McpClientManager:
             raise ConfigurationError("Configuration not loaded")
 
         all_tools: list[Tool] = []
-        enabled_servers = self._config.get_enabled_servers()
+        enabled_servers = self._enabled_servers
 
         if not enabled_servers:
             logger.warning("No enabled servers configured")
@@ -401,20 +550,14 @@ class McpClientManager:
 
         logger.info(f"Listing tools from {len(enabled_servers)} enabled servers")
 
-        for server_name, server_config in enabled_servers.items():
-            try:
-                # Connect to server if not already connected
-                if server_name not in self._clients:
-                    await self._connect_to_server(server_name, server_config)
-
-                # Get tools from server (uses cache if available)
-                tools = await self._get_server_tools(server_name)
-                all_tools.extend(tools)
-                logger.debug(f"Server '{server_name}': {len(tools)} tools")
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(self._connect_and_list(server_name, server_config))
+                for server_name, server_config in enabled_servers.items()
+            ]
 
-            except Exception as e:
-                logger.error(f"Failed to list tools from server '{server_name}': {e}")
-                # Continue with other servers rather than failing completely
+        for task in tasks:
+            all_tools.extend(task.result())
 
         logger.info(f"Total tools available: {len(all_tools)}")
         return all_tools
@@ -427,68 +570,50 @@ class McpClientManager:
         """
         logger.info("Cleaning up MCP Client Manager")
 
-        # Properly exit all session contexts
-        for server_name in list(self._session_contexts.keys()):
+        # Close every entered stdio/session context in reverse order
+        if self._exit_stack is not None:
             try:
-                session_ctx = self._session_contexts[server_name]
-                await session_ctx.__aexit__(None, None, None)
-                logger.debug(f"Closed session context for server: {server_name}")
+                await self._exit_stack.aclose()
+                logger.debug("Closed all connection contexts")
             except (RuntimeError, asyncio.CancelledError) as e:
                 # Ignore cancel scope errors that can occur when contexts are entered
                 # and exited in different event loop tasks (e.g., when scripts call asyncio.run())
                 if "cancel scope" in str(e).lower() or isinstance(e, asyncio.CancelledError):
-                    logger.debug(
-                        f"Ignoring cancel scope error during cleanup for '{server_name}': {e}"
-                    )
+                    logger.debug(f"Ignoring cancel scope error during cleanup: {e}")
                 else:
-                    logger.error(f"Error closing session context for '{server_name}': {e}")
+                    logger.error(f"Error closing connection contexts: {e}")
             except Exception as e:
-                logger.error(f"Error closing session context for '{server_name}': {e}")
-
-        # Properly exit all stdio contexts
-        for server_name in list(self._stdio_contexts.keys()):
-            try:
-                stdio_ctx = self._stdio_contexts[server_name]
-                await stdio_ctx.__aexit__(None, None, None)
-                logger.debug(f"Closed stdio context for server: {server_name}")
-            except (RuntimeError, asyncio.CancelledError) as e:
-                # Ignore cancel scope errors that can occur when contexts are entered
-                # and exited in different event loop tasks (e.g., when scripts call asyncio.run())
-                if "cancel scope" in str(e).lower() or isinstance(e, asyncio.CancelledError):
-                    logger.debug(
-                        f"Ignoring cancel scope error during cleanup for '{server_name}': {e}"
-                    )
-                else:
-                    logger.error(f"Error closing stdio context for '{server_name}': {e}")
-            except Exception as e:
-                logger.error(f"Error closing stdio context for '{server_name}': {e}")
+                logger.error(f"Error closing connection contexts: {e}")
 
         # Clear all state
         self._clients.clear()
-        self._session_contexts.clear()
-        self._stdio_contexts.clear()
         self._tool_cache.clear()
-        self._read_streams.clear()
-        self._write_streams.clear()
+        self._tool_name_set.clear()
+        self._verified_tools.clear()
+        self._enabled_servers = {}
         self._config = None
+        self._exit_stack = None
         self._mark_uninitialized()
 
         logger.info("Cleanup complete")
 
 
-# Singleton pattern using lru_cache (thread-safe)
-@lru_cache(maxsize=1)
+# Module-level singleton; a plain global avoids lru_cache's argument hashing
+# and locking on every lookup, and the GIL makes the check-and-assign safe
+_MANAGER: McpClientManager | None = None
+
+
 def get_mcp_client_manager() -> McpClientManager:
     """Get or create the singleton MCP Client Manager instance.
 
-    This function uses functools.lru_cache to ensure only one instance
-    of the manager exists, providing thread-safe singleton behavior.
-
     Returns:
         The singleton McpClientManager instance
     """
-    logger.debug("Getting MCP Client Manager singleton")
-    return McpClientManager()
+    global _MANAGER
+    if _MANAGER is None:
+        logger.debug("Creating MCP Client Manager singleton")
+        _MANAGER = McpClientManager()
+    return _MANAGER
 
 
 async def call_mcp_tool(tool_identifier: str, params: dict[str, Any]) -> Any:
@@ -511,3 +636,27 @@ async def call_mcp_tool(tool_identifier: str, params: dict[str, Any]) -> Any:
     """
     manager = get_mcp_client_manager()
     return await manager.call_tool(tool_identifier, params)
+
+
+async def invoke_mcp_tool(
+    tool_identifier: str,
+    params: dict[str, Any],
+    post: Callable[[Any], Any] | None = None,
+) -> Any:
+    """Call a tool on the singleton manager and apply an optional post-step.
+
+    Generated wrappers are thin adapters whose whole body is a single await
+    plus a normalization call. By folding the post-processing step in here,
+    those wrappers can be plain ``def`` functions that return this coroutine
+    directly, saving one coroutine-frame allocation per call.
+
+    Args:
+        tool_identifier: Tool identifier in format "serverName__toolName"
+        params: Dictionary of parameters to pass to the tool
+        post: Optional callable applied to the result before returning
+
+    Returns:
+        The tool execution result, passed through ``post`` when given
+    """
+    result = await get_mcp_client_manager().call_tool(tool_identifier, params)
+    return post(result) if post is not None else result
@@ -6,6 +6,7 @@ but expect PascalCase prefixes in certain contexts. This module provides
 configurable normalization strategies.
 """
 
+from collections.abc import Callable
 from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict
@@ -64,6 +65,22 @@ def normalize_field_names(obj: Any, server_name: str) -> Any:
         return obj
 
 
+# Key prefixes normalize_ado_fields rewrites; used by the quick pre-scan
+_ADO_PREFIXES = ("system.", "microsoft.", "custom.", "wef_")
+
+
+def _needs_ado_normalization(obj: Any) -> bool:
+    """Allocation-free scan for any key a full normalization pass would rename."""
+    if isinstance(obj, dict):
+        return any(
+            key.startswith(_ADO_PREFIXES) or _needs_ado_normalization(value)
+            for key, value in obj.items()
+        )
+    if isinstance(obj, list):
+        return any(_needs_ado_normalization(item) for item in obj)
+    return False
+
+
 def normalize_ado_fields(obj: Any) -> Any:
     """
     ADO-specific field normalization.
@@ -75,7 +92,9 @@ def normalize_ado_fields(obj: Any) -> Any:
     - wef_* → WEF_*
 
     Recursively processes nested structures.
-    Returns new object (immutable).
+    Returns new object (immutable). Payloads that contain no renameable
+    keys are returned unchanged: a quick scan that allocates nothing
+    replaces the full rebuild on that fast path.
 
     Args:
         obj: Object to normalize
@@ -94,6 +113,10 @@ def normalize_ado_fields(obj: Any) -> Any:
     if obj is None or isinstance(obj, (str, int, float, bool)):
         return obj
 
+    # Already-normalized payloads skip the rebuild entirely
+    if isinstance(obj, (dict, list)) and not _needs_ado_normalization(obj):
+        return obj
+
     # Handle lists
     if isinstance(obj, list):
         return [normalize_ado_fields(item) for item in obj]
@@ -123,6 +146,39 @@ def normalize_ado_fields(obj: Any) -> Any:
     return obj
 
 
+def _identity(obj: Any) -> Any:
+    """Pass-through normalizer for the "none" strategy."""
+    return obj
+
+
+def get_normalizer(server_name: str) -> Callable[[Any], Any]:
+    """
+    Resolve a server's normalization strategy once and return it as a callable.
+
+    Callers that normalize on every response (e.g. generated wrappers) can
+    bind the result at import time and skip the per-call strategy lookup.
+    The strategy is captured at resolution time: a later
+    update_normalization_config call is not reflected in already-bound
+    normalizers.
+
+    Args:
+        server_name: Name of the server (determines strategy)
+
+    Returns:
+        Callable applying the server's normalization to an object
+
+    Examples:
+        >>> normalize = get_normalizer("ado")
+        >>> normalize({"system.title": "foo"})
+        {'System.title': 'foo'}
+    """
+    strategy = NORMALIZATION_CONFIG.servers.get(server_name, "none")
+
+    if strategy == "ado-pascal-case":
+        return normalize_ado_fields
+    return _identity
+
+
 def update_normalization_config(server_name: str, strategy: NormalizationStrategy) -> None:
     """
     Update normalization strategy for a server.
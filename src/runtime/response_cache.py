@@ -0,0 +1,102 @@
+"""
+Opt-in response caching for repeated read-only tool calls.
+
+Read-only tools (status queries, list operations, content-addressed
+lookups) often return identical payloads for identical parameters within
+a short window, yet every call pays a full MCP round trip. ResponseCache
+lets scripts memoize those calls explicitly, keyed on the tool identifier
+plus canonicalized parameters, with per-call TTLs and a single epoch-based
+invalidation hook to run after mutating calls.
+
+Caching is never applied implicitly: only calls routed through a cache
+instance are memoized, so plain wrapper calls keep their semantics.
+"""
+
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+from .mcp_client import invoke_mcp_tool
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def _canonical_params(params: dict[str, Any]) -> str:
+    """Serialize params with sorted keys so equivalent dicts share a cache key."""
+    if orjson is not None:
+        return orjson.dumps(params, option=orjson.OPT_SORT_KEYS).decode()
+    return json.dumps(params, sort_keys=True, separators=(",", ":"))
+
+
+class ResponseCache:
+    """LRU response cache with per-entry TTLs and epoch invalidation.
+
+    Entries are keyed on (tool identifier, canonical params). A ttl of
+    None caches until the next invalidate(); invalidate() bumps an epoch
+    counter, making every existing entry stale in O(1) instead of
+    clearing the dict under concurrent readers.
+
+    Example:
+        >>> cache = ResponseCache()
+        >>> status = await cache.call("git__git_status", {"repo_path": "."}, ttl=2.0)
+        >>> await cache.call("git__git_reset", {"repo_path": "."})  # doctest: +SKIP
+        >>> cache.invalidate()  # mutating call above made cached reads stale
+    """
+
+    __slots__ = ("_entries", "_epoch", "_max_entries")
+
+    def __init__(self, max_entries: int = 512) -> None:
+        # key -> (epoch, expires_at or None, value); dict order doubles as LRU
+        self._entries: dict[tuple[str, str], tuple[int, float | None, Any]] = {}
+        self._epoch = 0
+        self._max_entries = max_entries
+
+    def invalidate(self) -> None:
+        """Mark every cached entry stale (call after any mutating tool call)."""
+        self._epoch += 1
+
+    async def call(
+        self,
+        tool_identifier: str,
+        params: dict[str, Any],
+        ttl: float | None = None,
+        post: Callable[[Any], Any] | None = None,
+    ) -> Any:
+        """Call a tool through the cache, memoizing the (post-processed) result.
+
+        Args:
+            tool_identifier: Tool identifier in format "serverName__toolName"
+            params: Dictionary of parameters to pass to the tool
+            ttl: Seconds the entry stays fresh; None means until invalidate()
+            post: Optional post-step applied on miss (e.g. a bound normalizer)
+
+        Returns:
+            The tool execution result, cached across identical calls
+        """
+        key = (tool_identifier, _canonical_params(params))
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            epoch, expires_at, value = entry
+            if epoch == self._epoch and (expires_at is None or time.monotonic() < expires_at):
+                # Refresh LRU position
+                del self._entries[key]
+                self._entries[key] = entry
+                return value
+            del self._entries[key]
+
+        # Capture the epoch before the round trip: an invalidate() issued
+        # while this read is in flight must mark the result stale, not let a
+        # pre-mutation response be cached as fresh
+        epoch = self._epoch
+        result = await invoke_mcp_tool(tool_identifier, params, post)
+
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._entries[key] = (epoch, expires_at, result)
+        while len(self._entries) > self._max_entries:
+            self._entries.pop(next(iter(self._entries)))
+        return result
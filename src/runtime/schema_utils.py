@@ -4,6 +4,7 @@ JSON Schema to Pydantic model conversion utilities.
 Converts MCP tool schemas (JSON Schema format) to Pydantic model definitions.
 """
 
+from functools import cache
 from typing import Any
 
 
@@ -16,7 +17,7 @@ def json_schema_to_python_type(schema: dict[str, Any], required: bool = True) ->
         required: Whether field is required
 
     Returns:
-        Python type hint string (e.g., "str", "Optional[int]", "List[str]")
+        Python type hint string (e.g., "str", "Optional[int]", "Sequence[str]")
 
     Examples:
         >>> json_schema_to_python_type({"type": "string"}, True)
@@ -24,8 +25,21 @@ def json_schema_to_python_type(schema: dict[str, Any], required: bool = True) ->
         >>> json_schema_to_python_type({"type": "string"}, False)
         'Optional[str]'
         >>> json_schema_to_python_type({"type": "array", "items": {"type": "string"}})
-        'List[str]'
+        'Sequence[str]'
     """
+    # Handle anyOf/oneOf unions: without this, scalar fields wrapped in a
+    # union (e.g. {"anyOf": [{"type": "string"}, {"type": "null"}]}) fell
+    # through to the object default and came out as Dict[str, Any]
+    union_schemas = schema.get("anyOf") or schema.get("oneOf")
+    if isinstance(union_schemas, list) and union_schemas:
+        non_null = [s for s in union_schemas if s.get("type") != "null"]
+        if len(non_null) < len(union_schemas):
+            required = False
+        if len(non_null) == 1:
+            return json_schema_to_python_type(non_null[0], required)
+        # Heterogeneous union: no single Python type to name
+        return "Any" if required else "Optional[Any]"
+
     # Handle union types: ["string", "null"]
     if isinstance(schema.get("type"), list):
         types = schema["type"]
@@ -59,9 +73,12 @@ def json_schema_to_python_type(schema: dict[str, Any], required: bool = True) ->
         return f"Optional[{base_type}]" if not required else base_type
 
     elif schema_type == "array":
+        # Sequence over List: params are consumed once and never mutated, and
+        # Pydantic validates Sequence without the defensive list copy, so
+        # callers can pass tuples (or lists) straight through
         items_schema = schema.get("items", {"type": "object"})
         item_type = json_schema_to_python_type(items_schema, required=True)
-        base_type = f"List[{item_type}]"
+        base_type = f"Sequence[{item_type}]"
         return f"Optional[{base_type}]" if not required else base_type
 
     elif schema_type == "object":
@@ -124,6 +141,14 @@ def generate_pydantic_model(
     else:
         lines.append('    """Generated Pydantic model."""')
 
+    # Defer SchemaValidator construction to first validation so importing a
+    # wrapper module whose model is never validated stays cheap (same policy
+    # as the runtime config models). Params are one-shot request payloads:
+    # frozen skips the mutation guards and extra="forbid" catches typo'd
+    # field names at validation time.
+    lines.append("")
+    lines.append('    model_config = ConfigDict(defer_build=True, frozen=True, extra="forbid")')
+
     # Generate fields
     if not properties:
         lines.append("    pass")
@@ -141,13 +166,31 @@ def generate_pydantic_model(
             if field_desc:
                 lines.append(f'    """{field_desc}"""')
 
+    # Validation-free constructor for trusted internal callers: generated
+    # wrappers shape a dict that is immediately dumped, so the full validator
+    # pipeline is skippable there. model_validate remains the entry point for
+    # untrusted input.
+    lines.extend(
+        [
+            "",
+            "    @classmethod",
+            f'    def build(cls, **kwargs: Any) -> "{model_name}":',
+            '        """Construct without validation (trusted callers only)."""',
+            "        return cls.model_construct(**kwargs)",
+        ]
+    )
+
     return "\n".join(lines)
 
 
+@cache
 def sanitize_name(name: str) -> str:
     """
     Sanitize name for Python identifier.
 
+    Results are memoized; generation passes sanitize the same tool names
+    repeatedly, so each distinct name is transformed only once.
+
     Args:
         name: Original name
 
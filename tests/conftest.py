@@ -0,0 +1,15 @@
+"""Shared pytest configuration for all test suites."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Point the on-disk caches at tmp_path so tests never touch the user cache.
+
+    The runtime's config, script-bytecode, and params caches all live under
+    ~/.cache/mcp-code-execution by default; without this override every test
+    run would leak entries there permanently. The env var is inherited by
+    subprocesses, so harness integration tests are covered too.
+    """
+    monkeypatch.setenv("MCP_CODE_EXECUTION_CACHE_DIR", str(tmp_path / "cache"))
@@ -5,6 +5,7 @@ from pathlib import Path
 
 import pytest
 
+from runtime import mcp_client
 from runtime.mcp_client import get_mcp_client_manager
 
 
@@ -46,11 +47,11 @@ async def cleanup_mcp_manager():
 
     This fixture ensures that:
     1. Each test gets a fresh manager instance
-    2. The singleton cache is cleared between tests
+    2. The module-level singleton is reset between tests
     3. All connections are properly closed
 
-    This is critical because get_mcp_client_manager() uses @lru_cache
-    which would otherwise share state across all tests.
+    This is critical because get_mcp_client_manager() returns a
+    module-level singleton which would otherwise share state across all tests.
     """
     # Yield to run the test
     yield
@@ -59,11 +60,11 @@ async def cleanup_mcp_manager():
     try:
         manager = get_mcp_client_manager()
         # Only cleanup if manager was initialized
-        if manager._state.value != "uninitialized":
+        if manager._state is not mcp_client.ConnectionState.UNINITIALIZED:
             await manager.cleanup()
     except Exception as e:
         # Log but don't fail if cleanup has issues
         print(f"Warning: Manager cleanup failed: {e}")
     finally:
-        # Clear the lru_cache to ensure next test gets fresh instance
-        get_mcp_client_manager.cache_clear()
+        # Reset the singleton to ensure next test gets a fresh instance
+        mcp_client._MANAGER = None
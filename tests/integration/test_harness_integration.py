@@ -13,11 +13,10 @@ else:
     PYTHON_EXECUTABLE = sys.executable
 
 
-def test_harness_simple_script():
+def test_harness_simple_script(tmp_path):
     """Test harness executes simple script successfully."""
-    # Create test script
-    test_script = Path("workspace/test_harness_simple.py")
-    test_script.parent.mkdir(exist_ok=True)
+    # Create test script (tmp_path keeps parallel workers isolated)
+    test_script = tmp_path / "test_harness_simple.py"
     test_script.write_text(
         """
 print("Test output")
@@ -36,10 +35,10 @@ print("Test output")
     assert "Test output" in result.stdout
 
 
-def test_harness_script_with_mcp():
+def test_harness_script_with_mcp(tmp_path):
     """Test harness executes script that uses MCP tools."""
     # Create test script
-    test_script = Path("workspace/test_harness_mcp.py")
+    test_script = tmp_path / "test_harness_mcp.py"
     test_script.write_text(
         """
 import asyncio
@@ -66,10 +65,10 @@ asyncio.run(main())
     assert "Git status result: True" in result.stdout
 
 
-def test_harness_script_error():
+def test_harness_script_error(tmp_path):
     """Test harness handles script errors."""
     # Create failing script
-    test_script = Path("workspace/test_harness_error.py")
+    test_script = tmp_path / "test_harness_error.py"
     test_script.write_text(
         """
 raise Exception("Test error")
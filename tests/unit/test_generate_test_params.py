@@ -5,14 +5,27 @@ Tests the tool classification logic and discovery config generation.
 Note: LLM-based parameter generation is tested with mocks to avoid API calls.
 """
 
+from unittest.mock import AsyncMock
+
+import pytest
+
 from src.runtime.generate_test_params import (
     ToolSafety,
+    _slim_schema,
     build_discovery_config,
     classify_tool,
     generate_test_parameters,
 )
 
 
+@pytest.fixture
+def mock_generate_params(monkeypatch):
+    """Swap generate_test_parameters for a canned AsyncMock (no LLM call)."""
+    mock = AsyncMock(return_value={"id": "123"})
+    monkeypatch.setattr("src.runtime.generate_test_params.generate_test_parameters", mock)
+    return mock
+
+
 class TestToolClassification:
     """Test tool classification logic."""
 
@@ -80,19 +93,17 @@ class TestToolClassification:
 class TestBuildDiscoveryConfig:
     """Test discovery config building."""
 
-    def test_build_empty_config(self) -> None:
+    async def test_build_empty_config(self) -> None:
         """Building config from empty servers returns valid structure."""
-        config = build_discovery_config({})
+        config = await build_discovery_config({})
         assert "servers" in config
         assert "metadata" in config
         assert config["servers"] == {}
         assert config["metadata"]["generated_count"] == 0
         assert config["metadata"]["skipped_count"] == 0
 
-    def test_build_config_skips_dangerous(self) -> None:
+    async def test_build_config_skips_dangerous(self, mock_generate_params) -> None:
         """Dangerous tools are skipped by default."""
-        from unittest.mock import patch
-
         servers_tools = {
             "test_server": [
                 {
@@ -108,20 +119,16 @@ class TestBuildDiscoveryConfig:
             ]
         }
 
-        # Mock the parameter generation to avoid needing anthropic API
-        with patch("src.runtime.generate_test_params.generate_test_parameters") as mock_gen:
-            mock_gen.return_value = {"id": "123"}
+        config = await build_discovery_config(servers_tools, skip_dangerous=True)
 
-            config = build_discovery_config(servers_tools, skip_dangerous=True)
+        assert "test_server" in config["servers"]
+        safe_tools = config["servers"]["test_server"]["safeTools"]
+        assert "get_user" in safe_tools
+        assert "delete_user" not in safe_tools
+        assert config["metadata"]["skipped_count"] == 1
+        assert "delete_user" in config["metadata"]["tools_skipped"]["dangerous"]
 
-            assert "test_server" in config["servers"]
-            safe_tools = config["servers"]["test_server"]["safeTools"]
-            assert "get_user" in safe_tools
-            assert "delete_user" not in safe_tools
-            assert config["metadata"]["skipped_count"] == 1
-            assert "delete_user" in config["metadata"]["tools_skipped"]["dangerous"]
-
-    def test_build_config_includes_dangerous_when_flag_false(self) -> None:
+    async def test_build_config_includes_dangerous_when_flag_false(self) -> None:
         """Dangerous tools can be included if skip_dangerous=False."""
         servers_tools = {
             "test_server": [
@@ -133,12 +140,12 @@ class TestBuildDiscoveryConfig:
             ]
         }
 
-        config = build_discovery_config(servers_tools, skip_dangerous=False)
+        config = await build_discovery_config(servers_tools, skip_dangerous=False)
 
         # Still skipped because we can't generate params without mocking
         assert config["metadata"]["skipped_count"] >= 0
 
-    def test_build_config_skips_unknown(self) -> None:
+    async def test_build_config_skips_unknown(self) -> None:
         """Unknown tools are skipped (param generation fails)."""
         servers_tools = {
             "test_server": [
@@ -150,16 +157,16 @@ class TestBuildDiscoveryConfig:
             ]
         }
 
-        config = build_discovery_config(servers_tools)
+        config = await build_discovery_config(servers_tools)
 
         assert "test_server" not in config["servers"] or (
             "unknown_operation" not in config["servers"]["test_server"].get("safeTools", {})
         )
         assert config["metadata"]["skipped_count"] >= 1
 
-    def test_build_config_metadata(self) -> None:
+    async def test_build_config_metadata(self) -> None:
         """Generated config includes proper metadata."""
-        config = build_discovery_config({})
+        config = await build_discovery_config({})
 
         metadata = config["metadata"]
         assert metadata["generated"] is True
@@ -169,7 +176,7 @@ class TestBuildDiscoveryConfig:
         assert "dangerous" in metadata["tools_skipped"]
         assert "unknown" in metadata["tools_skipped"]
 
-    def test_build_config_missing_tool_name(self) -> None:
+    async def test_build_config_missing_tool_name(self) -> None:
         """Tools without names are skipped."""
         servers_tools = {
             "test_server": [
@@ -181,14 +188,14 @@ class TestBuildDiscoveryConfig:
             ]
         }
 
-        config = build_discovery_config(servers_tools)
+        config = await build_discovery_config(servers_tools)
 
         assert (
             "test_server" not in config["servers"]
             or len(config["servers"]["test_server"].get("safeTools", {})) == 0
         )
 
-    def test_build_config_multiple_servers(self) -> None:
+    async def test_build_config_multiple_servers(self) -> None:
         """Config correctly handles multiple servers."""
         servers_tools = {
             "server1": [
@@ -207,7 +214,7 @@ class TestBuildDiscoveryConfig:
             ],
         }
 
-        config = build_discovery_config(servers_tools)
+        config = await build_discovery_config(servers_tools)
 
         # At least the structure should be there (actual population depends on param generation)
         assert "servers" in config
@@ -217,7 +224,7 @@ class TestBuildDiscoveryConfig:
 class TestGenerateTestParameters:
     """Test parameter generation with Claude API flag."""
 
-    def test_generate_with_claude_api_disabled(self) -> None:
+    async def test_generate_with_claude_api_disabled(self) -> None:
         """When use_claude_api=False, parameter generation returns None without API call."""
         schema = {
             "type": "object",
@@ -225,25 +232,25 @@ class TestGenerateTestParameters:
             "required": ["name"],
         }
 
-        result = generate_test_parameters("test_tool", schema, use_claude_api=False)
+        result = await generate_test_parameters("test_tool", schema, use_claude_api=False)
 
         assert result is None
 
-    def test_generate_with_claude_api_enabled_default(self) -> None:
+    async def test_generate_with_claude_api_enabled_default(self) -> None:
         """Default behavior is use_claude_api=True (skips without anthropic installed)."""
         schema = {
             "type": "object",
             "properties": {"name": {"type": "string"}},
         }
 
-        result = generate_test_parameters("test_tool", schema)
+        result = await generate_test_parameters("test_tool", schema)
 
         # Will be None because anthropic isn't properly installed/configured
         # But the point is it tries to use the API rather than returning None immediately
         # This is tested implicitly by the fact that the function doesn't short-circuit
         assert result is None or isinstance(result, dict)
 
-    def test_generate_with_claude_code_flag(self) -> None:
+    async def test_generate_with_claude_code_flag(self) -> None:
         """When use_claude_code=True, uses subprocess instead of API."""
         from unittest.mock import MagicMock, patch
 
@@ -260,7 +267,7 @@ class TestGenerateTestParameters:
         mock_result.stderr = ""
 
         with patch("subprocess.run", return_value=mock_result) as mock_run:
-            result = generate_test_parameters("test_tool", schema, use_claude_code=True)
+            result = await generate_test_parameters("test_tool", schema, use_claude_code=True)
 
             assert mock_run.called
             assert result == {"name": "test"}
@@ -270,7 +277,7 @@ class TestGenerateTestParameters:
             assert call_args[1] == "-p"
             assert "--dangerously-skip-permissions" in call_args
 
-    def test_generate_with_claude_code_cli_not_found(self) -> None:
+    async def test_generate_with_claude_code_cli_not_found(self) -> None:
         """When Claude Code CLI is not installed, returns None gracefully."""
         from unittest.mock import patch
 
@@ -280,11 +287,11 @@ class TestGenerateTestParameters:
         }
 
         with patch("subprocess.run", side_effect=FileNotFoundError()):
-            result = generate_test_parameters("test_tool", schema, use_claude_code=True)
+            result = await generate_test_parameters("test_tool", schema, use_claude_code=True)
 
             assert result is None
 
-    def test_generate_with_claude_code_precedence(self) -> None:
+    async def test_generate_with_claude_code_precedence(self) -> None:
         """Claude Code takes precedence over Claude API when both enabled."""
         from unittest.mock import MagicMock, patch
 
@@ -296,11 +303,13 @@ class TestGenerateTestParameters:
 
         with patch("subprocess.run", return_value=mock_result) as mock_run:
             # Both enabled, should use claude_code
-            generate_test_parameters("test_tool", schema, use_claude_api=True, use_claude_code=True)
+            await generate_test_parameters(
+                "test_tool", schema, use_claude_api=True, use_claude_code=True
+            )
 
             assert mock_run.called
 
-    def test_generate_with_copilot_cli_flag(self) -> None:
+    async def test_generate_with_copilot_cli_flag(self) -> None:
         """When use_copilot_cli=True, uses subprocess to call copilot."""
         from unittest.mock import MagicMock, patch
 
@@ -317,7 +326,7 @@ class TestGenerateTestParameters:
         mock_result.stderr = ""
 
         with patch("subprocess.run", return_value=mock_result) as mock_run:
-            result = generate_test_parameters("test_tool", schema, use_copilot_cli=True)
+            result = await generate_test_parameters("test_tool", schema, use_copilot_cli=True)
 
             assert mock_run.called
             assert result == {"name": "test"}
@@ -327,7 +336,7 @@ class TestGenerateTestParameters:
             assert call_args[1] == "-p"
             assert "--allow-all-tools" in call_args
 
-    def test_generate_with_copilot_cli_not_found(self) -> None:
+    async def test_generate_with_copilot_cli_not_found(self) -> None:
         """When Copilot CLI is not installed, returns None gracefully."""
         from unittest.mock import patch
 
@@ -337,11 +346,11 @@ class TestGenerateTestParameters:
         }
 
         with patch("subprocess.run", side_effect=FileNotFoundError()):
-            result = generate_test_parameters("test_tool", schema, use_copilot_cli=True)
+            result = await generate_test_parameters("test_tool", schema, use_copilot_cli=True)
 
             assert result is None
 
-    def test_generate_with_copilot_cli_precedence_over_claude_code(self) -> None:
+    async def test_generate_with_copilot_cli_precedence_over_claude_code(self) -> None:
         """Copilot CLI takes precedence over Claude Code when both enabled."""
         from unittest.mock import MagicMock, patch
 
@@ -353,7 +362,7 @@ class TestGenerateTestParameters:
 
         with patch("subprocess.run", return_value=mock_result) as mock_run:
             # Both enabled, should use copilot_cli
-            generate_test_parameters(
+            await generate_test_parameters(
                 "test_tool", schema, use_claude_code=True, use_copilot_cli=True
             )
 
@@ -362,7 +371,7 @@ class TestGenerateTestParameters:
             call_args = mock_run.call_args[0][0]
             assert call_args[0] == "copilot"
 
-    def test_generate_with_copilot_cli_precedence_over_all(self) -> None:
+    async def test_generate_with_copilot_cli_precedence_over_all(self) -> None:
         """Copilot CLI takes precedence over both Claude Code and API when all enabled."""
         from unittest.mock import MagicMock, patch
 
@@ -374,7 +383,7 @@ class TestGenerateTestParameters:
 
         with patch("subprocess.run", return_value=mock_result) as mock_run:
             # All enabled, should use copilot_cli
-            generate_test_parameters(
+            await generate_test_parameters(
                 "test_tool",
                 schema,
                 use_claude_api=True,
@@ -388,14 +397,46 @@ class TestGenerateTestParameters:
             assert call_args[0] == "copilot"
 
 
+class TestSlimSchema:
+    """Test prompt-schema slimming."""
+
+    def test_strips_noise_keys_from_schema_nodes(self) -> None:
+        """description/examples/$comment are dropped from schema nodes."""
+        schema = {
+            "type": "object",
+            "description": "A tool",
+            "properties": {
+                "path": {"type": "string", "description": "A path", "examples": ["."]},
+            },
+        }
+        assert _slim_schema(schema) == {
+            "type": "object",
+            "properties": {"path": {"type": "string"}},
+        }
+
+    def test_keeps_properties_named_like_noise_keys(self) -> None:
+        """A parameter named 'description' is data, not a noise key."""
+        schema = {
+            "type": "object",
+            "properties": {"description": {"type": "string"}},
+            "required": ["description"],
+        }
+        assert _slim_schema(schema) == schema
+
+    def test_truncates_long_enums(self) -> None:
+        """Enums longer than the cap are truncated."""
+        schema = {"type": "string", "enum": list("abcdefgh")}
+        assert _slim_schema(schema)["enum"] == list("abcde")
+
+
 class TestToolSafetyEnum:
     """Test ToolSafety enum."""
 
     def test_tool_safety_values(self) -> None:
-        """ToolSafety enum has expected values."""
-        assert ToolSafety.SAFE.value == "safe"
-        assert ToolSafety.DANGEROUS.value == "dangerous"
-        assert ToolSafety.UNKNOWN.value == "unknown"
+        """ToolSafety enum has expected labels."""
+        assert ToolSafety.SAFE.name.lower() == "safe"
+        assert ToolSafety.DANGEROUS.name.lower() == "dangerous"
+        assert ToolSafety.UNKNOWN.name.lower() == "unknown"
 
     def test_tool_safety_comparison(self) -> None:
         """ToolSafety enum members can be compared."""
@@ -26,7 +26,7 @@ def test_json_schema_array_type():
     """Test array type conversion."""
     schema = {"type": "array", "items": {"type": "string"}}
     result = json_schema_to_python_type(schema, True)
-    assert result == "List[str]"
+    assert result == "Sequence[str]"
 
 
 def test_json_schema_enum_type():
@@ -43,6 +43,19 @@ def test_json_schema_union_type():
     assert result == "Optional[str]"
 
 
+def test_json_schema_anyof_scalar():
+    """Test anyOf union with null unwraps to an Optional scalar."""
+    schema = {"anyOf": [{"type": "string"}, {"type": "null"}]}
+    assert json_schema_to_python_type(schema, True) == "Optional[str]"
+
+    schema = {"oneOf": [{"type": "integer"}]}
+    assert json_schema_to_python_type(schema, True) == "int"
+
+    # Heterogeneous unions fall back to Any
+    schema = {"anyOf": [{"type": "string"}, {"type": "integer"}]}
+    assert json_schema_to_python_type(schema, True) == "Any"
+
+
 def test_json_schema_dict_type():
     """Test dict (additionalProperties) type conversion."""
     schema = {"type": "object", "additionalProperties": {"type": "string"}}
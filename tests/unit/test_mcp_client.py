@@ -18,6 +18,7 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from runtime import mcp_client
 from runtime.exceptions import (
     ConfigurationError,
     ServerConnectionError,
@@ -513,7 +514,7 @@ class TestDefensiveUnwrapping:
 
 
 class TestSingletonPattern:
-    """Test singleton behavior using lru_cache."""
+    """Test singleton behavior of the module-level manager."""
 
     def test_get_manager_returns_same_instance(self) -> None:
         """Multiple calls should return the same instance."""
@@ -523,8 +524,8 @@ class TestSingletonPattern:
 
     def test_singleton_state_persists(self) -> None:
         """State should persist across get_mcp_client_manager calls."""
-        # Clear the cache to start fresh
-        get_mcp_client_manager.cache_clear()
+        # Reset the singleton to start fresh
+        mcp_client._MANAGER = None
 
         manager1 = get_mcp_client_manager()
         manager1._state = ConnectionState.INITIALIZED
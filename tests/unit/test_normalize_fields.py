@@ -2,6 +2,7 @@
 
 from runtime.normalize_fields import (
     get_normalization_strategy,
+    get_normalizer,
     normalize_ado_fields,
     normalize_field_names,
     update_normalization_config,
@@ -99,6 +100,19 @@ def test_ado_normalization_recursion():
     }
 
 
+def test_ado_normalization_already_normalized_fast_path():
+    """Test that payloads with no renameable keys are returned unchanged."""
+    input_obj = {
+        "System.title": "Title",
+        "fields": {"Custom.status": "Active", "plain": [1, 2]},
+    }
+
+    result = normalize_ado_fields(input_obj)
+
+    # No key needs renaming, so the original object comes back as-is
+    assert result is input_obj
+
+
 def test_normalize_field_names_strategy_dispatch():
     """Test that normalize_field_names dispatches to correct strategy."""
     input_obj = {"system.title": "Title"}
@@ -156,3 +170,14 @@ def test_ado_normalization_unknown_type():
 
     # Unknown type should be returned as-is
     assert result is custom_obj
+
+
+def test_get_normalizer_binds_strategy():
+    """Test that get_normalizer returns the resolved strategy as a callable."""
+    normalize = get_normalizer("ado")
+    assert normalize({"system.title": "foo"}) == {"System.title": "foo"}
+
+    # "none" strategy servers get a pass-through
+    passthrough = get_normalizer("github")
+    input_obj = {"system.title": "foo"}
+    assert passthrough(input_obj) is input_obj
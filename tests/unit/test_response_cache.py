@@ -0,0 +1,138 @@
+"""Unit tests for the opt-in response cache."""
+
+import pytest
+
+from runtime import mcp_client
+from runtime.response_cache import ResponseCache
+
+
+class CountingManager:
+    """Fake manager that counts call_tool invocations."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def call_tool(self, tool_identifier, params):
+        self.calls += 1
+        return {"tool": tool_identifier, "n": self.calls}
+
+
+@pytest.fixture
+def manager():
+    """Install a counting fake as the singleton manager."""
+    fake = CountingManager()
+    mcp_client._MANAGER = fake
+    yield fake
+    mcp_client._MANAGER = None
+
+
+async def test_cache_hit_skips_round_trip(manager):
+    """Identical calls are served from cache without hitting the manager."""
+    cache = ResponseCache()
+
+    first = await cache.call("git__git_status", {"repo_path": "."})
+    second = await cache.call("git__git_status", {"repo_path": "."})
+
+    assert first is second
+    assert manager.calls == 1
+
+    # Equivalent params with different key order share a cache entry
+    await cache.call("git__git_show", {"a": 1, "b": 2})
+    await cache.call("git__git_show", {"b": 2, "a": 1})
+    assert manager.calls == 2
+
+
+async def test_cache_distinguishes_params(manager):
+    """Different params produce separate entries."""
+    cache = ResponseCache()
+
+    await cache.call("git__git_status", {"repo_path": "."})
+    await cache.call("git__git_status", {"repo_path": "/other"})
+
+    assert manager.calls == 2
+
+
+async def test_invalidate_marks_entries_stale(manager):
+    """invalidate() forces the next call back to the manager."""
+    cache = ResponseCache()
+
+    await cache.call("git__git_tag", {"mode": "list"})
+    cache.invalidate()
+    await cache.call("git__git_tag", {"mode": "list"})
+
+    assert manager.calls == 2
+
+
+async def test_invalidate_during_in_flight_call(manager):
+    """A read in flight when invalidate() fires is cached as stale."""
+    import asyncio
+
+    cache = ResponseCache()
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    original_call_tool = manager.call_tool
+
+    async def slow_call_tool(tool_identifier, params):
+        started.set()
+        await release.wait()
+        return await original_call_tool(tool_identifier, params)
+
+    manager.call_tool = slow_call_tool
+
+    task = asyncio.ensure_future(cache.call("git__git_log", {"repo_path": "."}))
+    await started.wait()
+    cache.invalidate()  # mutation lands while the read is in flight
+    release.set()
+    await task
+
+    # The pre-mutation result must not be served as fresh
+    await cache.call("git__git_log", {"repo_path": "."})
+    assert manager.calls == 2
+
+
+async def test_ttl_expiry(manager, monkeypatch):
+    """Entries past their TTL are refetched."""
+    import runtime.response_cache as response_cache
+
+    now = 100.0
+    monkeypatch.setattr(response_cache.time, "monotonic", lambda: now)
+
+    cache = ResponseCache()
+    await cache.call("git__git_status", {"repo_path": "."}, ttl=2.0)
+
+    now = 101.0
+    await cache.call("git__git_status", {"repo_path": "."}, ttl=2.0)
+    assert manager.calls == 1
+
+    now = 103.0
+    await cache.call("git__git_status", {"repo_path": "."}, ttl=2.0)
+    assert manager.calls == 2
+
+
+async def test_lru_eviction(manager):
+    """Oldest entries are evicted once max_entries is exceeded."""
+    cache = ResponseCache(max_entries=2)
+
+    await cache.call("t", {"i": 1})
+    await cache.call("t", {"i": 2})
+    await cache.call("t", {"i": 3})  # evicts {"i": 1}
+    await cache.call("t", {"i": 1})
+
+    assert manager.calls == 4
+
+
+async def test_post_step_applied_once(manager):
+    """The post callable runs on miss; hits return the processed value."""
+    cache = ResponseCache()
+    seen = []
+
+    def post(result):
+        seen.append(result)
+        return {"wrapped": result}
+
+    first = await cache.call("git__git_status", {"repo_path": "."}, post=post)
+    second = await cache.call("git__git_status", {"repo_path": "."}, post=post)
+
+    assert first == second == {"wrapped": {"tool": "git__git_status", "n": 1}}
+    assert len(seen) == 1